@@ -0,0 +1,507 @@
+"""
+FastAPI service exposing the Wheel Strategy Analyzer over HTTP
+"""
+
+import asyncio
+import functools
+import hashlib
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+import anyio
+import httpx
+import orjson
+import pandas as pd
+import uvicorn
+import yfinance as yf
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+
+from src.analyzer import WheelAnalyzer
+from src.http import SESSION
+from src.options_chain import OptionsChain
+
+logger = logging.getLogger(__name__)
+
+# Dedicated pool for blocking analyzer/yfinance work so we never run it on the
+# event loop (async def routes do NOT get Starlette's threadpool) and never
+# compete with Starlette's own default executor.
+executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="analyzer")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Construct at startup (not import) so config I/O happens after workers
+    # fork and startup failures surface immediately.
+    app.state.analyzer = WheelAnalyzer()
+    # Widen anyio's default 40-token limiter so blocking calls routed through
+    # Starlette internals (file responses, dependencies) don't queue behind
+    # analyzer work under load
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 64
+    # Shared pooled client for the fully-async upstream paths
+    app.state.http = httpx.AsyncClient(limits=httpx.Limits(max_connections=100))
+
+    # Compilation is blocking, so keep the kernel warm-up off the event loop
+    await asyncio.to_thread(app.state.analyzer.prewarm)
+
+    if app.state.analyzer.config.get('io', {}).get('warm_screen_on_startup', False):
+        try:
+            await asyncio.to_thread(app.state.analyzer.screen_stocks)
+        except Exception:
+            logger.warning("Default screen warm-up failed", exc_info=True)
+
+    yield
+    await app.state.http.aclose()
+    executor.shutdown(wait=False)
+
+
+app = FastAPI(
+    title="Wheel Strategy Analyzer",
+    description="API for analyzing stocks suitable for the options wheel strategy",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+# Option-chain payloads are repetitive JSON; gzip cuts them 5-10x
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+def get_analyzer(request: Request) -> WheelAnalyzer:
+    """Dependency returning the analyzer constructed during startup."""
+    return request.app.state.analyzer
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking analyzer call on the shared executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+def df_envelope_bytes(df: pd.DataFrame, extra: Optional[dict] = None) -> bytes:
+    """
+    Build the standard success envelope for a result frame as raw bytes.
+
+    The large endpoints concatenate the envelope around pandas' C-backed
+    records JSON, so no per-row dicts and no second serialization pass
+    are needed before the bytes hit the socket.
+
+    Args:
+        df: Result DataFrame serialized under the "results" key
+        extra: Additional envelope fields (serialized with orjson)
+
+    Returns:
+        Complete JSON response body
+    """
+    head = b'{"success":true,"count":' + str(len(df)).encode()
+    if extra:
+        head += b"," + orjson.dumps(extra)[1:-1]
+    records = df.to_json(orient="records", date_format="iso", double_precision=6).encode()
+    return head + b',"results":' + records + b"}"
+
+
+@functools.lru_cache(maxsize=512)
+def _chain_for(ticker: str, minute_bucket: int) -> OptionsChain:
+    """
+    Reuse one OptionsChain handle per ticker within a minute bucket.
+
+    Construction re-fetches stock metadata, so repeat lookups inside the
+    bucket share the instance; key rotation bounds staleness and the LRU
+    bounds memory.
+    """
+    return OptionsChain(ticker)
+
+
+class PriceBatcher:
+    """
+    Coalesce concurrent price lookups into bulk upstream fetches.
+
+    Concurrent requests for the same ticker await a single in-flight
+    future (single-flight), and distinct tickers queued within the wait
+    window are fetched with one bulk yfinance request. Results are held
+    in a 30-second bucket cache, so repeat requests are dict lookups.
+    """
+
+    def __init__(
+        self,
+        max_wait_ms: int = 20,
+        max_batch: int = 32,
+        cache_ttl: int = 30,
+        fetch_timeout: float = 15.0,
+    ):
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_batch = max_batch
+        self.cache_ttl = cache_ttl
+        self.fetch_timeout = fetch_timeout
+        self._cache: dict = {}
+        self._pending: dict = {}
+        self._lock = asyncio.Lock()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def get_price(self, ticker: str) -> Optional[float]:
+        bucket = int(time.time() // self.cache_ttl)
+        cached = self._cache.get(ticker)
+        if cached is not None and cached[0] == bucket:
+            return cached[1]
+
+        async with self._lock:
+            future = self._pending.get(ticker)
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                self._pending[ticker] = future
+                self._queue.put_nowait(ticker)
+                if self._worker is None or self._worker.done():
+                    self._worker = asyncio.create_task(self._drain())
+        # Shield so a timed-out waiter doesn't cancel the shared future;
+        # drop the pending entry so the next request retries the fetch
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self.fetch_timeout)
+        except asyncio.TimeoutError:
+            async with self._lock:
+                if self._pending.get(ticker) is future:
+                    del self._pending[ticker]
+            logger.error(f"Timed out waiting for price of {ticker}")
+            return None
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            # Hold the batch open briefly so concurrent arrivals share a fetch
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # A failed fetch must still resolve the batch's futures, or the
+            # waiters hang and the dead futures poison _pending for those
+            # tickers
+            try:
+                prices = await self._fetch(batch)
+            except Exception as e:
+                logger.error(f"Price fetch failed for {batch}: {e}")
+                prices = {}
+            bucket = int(time.time() // self.cache_ttl)
+            async with self._lock:
+                for ticker in batch:
+                    if ticker in prices:
+                        self._cache[ticker] = (bucket, prices[ticker])
+                    future = self._pending.pop(ticker, None)
+                    if future is not None and not future.done():
+                        future.set_result(prices.get(ticker))
+
+    async def _fetch(self, batch: List[str]) -> dict:
+        # Singleton batches take the async chart-endpoint path on the shared
+        # client; bulk batches stay on the threaded yfinance fetch
+        client = getattr(app.state, "http", None)
+        if len(batch) == 1 and client is not None:
+            ticker = batch[0]
+            chain = _chain_for(ticker, int(time.time() // 60))
+            price = await chain.async_get_current_price(client)
+            if price is not None:
+                return {ticker: price}
+        return await run_blocking(self._fetch_batch, batch)
+
+    @staticmethod
+    def _fetch_batch(tickers: List[str]) -> dict:
+        prices: dict = {}
+        try:
+            # Multi-ticker batches go through one bulk yf.download call;
+            # anything the download misses falls back to a per-ticker lookup
+            if len(tickers) > 1:
+                quotes = yf.download(
+                    " ".join(tickers),
+                    period="1d",
+                    interval="1d",
+                    group_by="ticker",
+                    progress=False,
+                    session=SESSION,
+                )
+                if quotes is not None and not quotes.empty:
+                    for ticker in tickers:
+                        try:
+                            closes = quotes[ticker]['Close'].dropna()
+                        except KeyError:
+                            continue
+                        if not closes.empty:
+                            prices[ticker] = float(closes.iloc[-1])
+            minute_bucket = int(time.time() // 60)
+            for ticker in tickers:
+                if ticker not in prices:
+                    prices[ticker] = _chain_for(ticker, minute_bucket).get_current_price()
+        except Exception as e:
+            logger.error(f"Batched price fetch failed for {tickers}: {e}")
+            for ticker in tickers:
+                prices.setdefault(ticker, None)
+        return prices
+
+
+price_batcher = PriceBatcher()
+
+
+def cacheable_json_response(request: Request, body: bytes, max_age: int) -> Response:
+    """
+    Wrap a pre-serialized body with an ETag and Cache-Control header.
+
+    Responses that are deterministic within a cache bucket get a strong
+    ETag (blake2b of the body); a matching If-None-Match short-circuits
+    to an empty 304 so clients and CDNs skip the body transfer.
+    """
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+class HealthResponse(BaseModel):
+    status: str
+
+
+class PriceResponse(BaseModel):
+    success: bool
+    ticker: str
+    price: float
+
+
+class PopularTickersResponse(BaseModel):
+    success: bool
+    count: int
+    results: List[str]
+
+
+class ScreenRequest(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+
+    tickers: Optional[List[str]] = None
+    min_market_cap: Optional[float] = None
+    min_iv_rank: Optional[float] = None
+    min_options_volume: Optional[int] = None
+
+
+class CompareRequest(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+
+    tickers: List[str]
+    strategy: str = "put"
+    target_dte: Optional[int] = None
+
+
+@app.get("/health", response_model=HealthResponse, response_class=ORJSONResponse)
+async def health():
+    return {"status": "ok"}
+
+
+@app.get("/popular-tickers", response_model=PopularTickersResponse, response_class=ORJSONResponse)
+async def popular_tickers(analyzer: WheelAnalyzer = Depends(get_analyzer)):
+    tickers = analyzer.screener.get_popular_wheel_tickers()
+    return {"success": True, "count": len(tickers), "results": tickers}
+
+
+@app.post("/screen")
+async def screen(
+    request: ScreenRequest,
+    http_request: Request,
+    analyzer: WheelAnalyzer = Depends(get_analyzer),
+):
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Screening stocks with criteria: %s", request.model_dump())
+    results = await run_blocking(
+        analyzer.screen_stocks,
+        tickers=request.tickers,
+        min_market_cap=request.min_market_cap,
+        min_iv_rank=request.min_iv_rank,
+        min_options_volume=request.min_options_volume,
+    )
+    body = df_envelope_bytes(results)
+    # The default screen is deterministic within its 15-minute bucket, so
+    # it is safe to let clients and CDNs hold it for that long
+    if request.tickers is None and not (
+        request.min_market_cap or request.min_iv_rank or request.min_options_volume
+    ):
+        return cacheable_json_response(http_request, body, max_age=900)
+    return Response(content=body, media_type="application/json")
+
+
+@app.post("/screen/stream")
+async def screen_stream(request: ScreenRequest, analyzer: WheelAnalyzer = Depends(get_analyzer)):
+    """Stream screening results as NDJSON, one row per line."""
+    results = await run_blocking(
+        analyzer.screen_stocks,
+        tickers=request.tickers,
+        min_market_cap=request.min_market_cap,
+        min_iv_rank=request.min_iv_rank,
+        min_options_volume=request.min_options_volume,
+    )
+
+    def _iter(df: pd.DataFrame):
+        # Serialize in slices so peak memory stays bounded and the first
+        # rows hit the wire before the rest of the frame is encoded
+        for start in range(0, len(df), 64):
+            chunk = df.iloc[start:start + 64]
+            yield chunk.to_json(
+                orient="records", lines=True, date_format="iso", double_precision=6
+            ).encode() + b"\n"
+
+    return StreamingResponse(_iter(results), media_type="application/x-ndjson")
+
+
+@app.get("/analyze/{ticker}")
+async def analyze(
+    http_request: Request,
+    ticker: str,
+    target_dte: Optional[int] = None,
+    analyzer: WheelAnalyzer = Depends(get_analyzer),
+):
+    analysis = await run_blocking(analyzer.analyze_ticker, ticker, target_dte)
+    if analysis.current_price is None:
+        raise HTTPException(status_code=404, detail=f"No data available for {ticker}")
+
+    # Both sides read the same cached chain, so compute them concurrently
+    # and serialize each frame exactly once into a hand-built envelope
+    puts, calls = await asyncio.gather(
+        run_blocking(analysis.get_put_opportunities),
+        run_blocking(analysis.get_call_opportunities),
+    )
+    head = orjson.dumps(
+        {
+            "success": True,
+            "ticker": analysis.ticker,
+            "current_price": analysis.current_price,
+            "expiration_date": analysis.expiration_date,
+        },
+        option=orjson.OPT_SERIALIZE_NUMPY,
+    )[:-1]
+    body = b"".join([
+        head,
+        b',"put_opportunities":',
+        puts.to_json(orient="records", date_format="iso", double_precision=6).encode(),
+        b',"call_opportunities":',
+        calls.to_json(orient="records", date_format="iso", double_precision=6).encode(),
+        b"}",
+    ])
+    return cacheable_json_response(http_request, body, max_age=30)
+
+
+@app.get("/ticker/{ticker}/puts")
+async def ticker_puts(
+    http_request: Request,
+    ticker: str,
+    target_dte: Optional[int] = None,
+    analyzer: WheelAnalyzer = Depends(get_analyzer),
+):
+    analysis = await run_blocking(analyzer.analyze_ticker, ticker, target_dte)
+    puts = await run_blocking(analysis.get_put_opportunities)
+    body = df_envelope_bytes(puts, {"ticker": analysis.ticker})
+    return cacheable_json_response(http_request, body, max_age=30)
+
+
+@app.get("/ticker/{ticker}/calls")
+async def ticker_calls(
+    http_request: Request,
+    ticker: str,
+    target_dte: Optional[int] = None,
+    analyzer: WheelAnalyzer = Depends(get_analyzer),
+):
+    analysis = await run_blocking(analyzer.analyze_ticker, ticker, target_dte)
+    calls = await run_blocking(analysis.get_call_opportunities)
+    body = df_envelope_bytes(calls, {"ticker": analysis.ticker})
+    return cacheable_json_response(http_request, body, max_age=30)
+
+
+@app.get("/ticker/{ticker}/price", response_model=PriceResponse, response_class=ORJSONResponse)
+async def ticker_price(ticker: str):
+    ticker = ticker.upper()
+    price = await price_batcher.get_price(ticker)
+    if price is None:
+        raise HTTPException(status_code=404, detail=f"No price available for {ticker}")
+    return {"success": True, "ticker": ticker, "price": price}
+
+
+@app.post("/compare")
+async def compare(request: CompareRequest, analyzer: WheelAnalyzer = Depends(get_analyzer)):
+    # One bulk download fetches every quote up front, then each ticker is
+    # analyzed concurrently; the semaphore caps in-flight upstream fetches
+    prefetched = await run_blocking(analyzer._prefetch, request.tickers)
+    semaphore = asyncio.Semaphore(8)
+
+    async def _one(ticker: str):
+        async with semaphore:
+            return await run_blocking(
+                analyzer.best_opportunity,
+                ticker,
+                strategy=request.strategy,
+                target_dte=request.target_dte,
+                prefetched_price=prefetched.get(ticker.upper()),
+            )
+
+    outcomes = await asyncio.gather(
+        *(_one(ticker) for ticker in request.tickers), return_exceptions=True
+    )
+
+    rows = []
+    failed_tickers = []
+    for ticker, outcome in zip(request.tickers, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error("Error analyzing %s: %s", ticker, outcome)
+            failed_tickers.append(ticker)
+        elif outcome is not None:
+            rows.append(outcome)
+
+    results = pd.DataFrame(rows)
+    if not results.empty:
+        results = results.sort_values("annualized_return", ascending=False)
+    return Response(
+        content=df_envelope_bytes(results, {"failed_tickers": failed_tickers}),
+        media_type="application/json",
+    )
+
+
+@app.get("/best-candidates")
+async def best_candidates(
+    http_request: Request,
+    min_annual_return: float = 20.0,
+    max_results: int = 10,
+    analyzer: WheelAnalyzer = Depends(get_analyzer),
+):
+    results = await run_blocking(
+        analyzer.find_best_wheel_candidates,
+        min_annual_return=min_annual_return,
+        max_results=max_results,
+    )
+    return cacheable_json_response(http_request, df_envelope_bytes(results), max_age=900)
+
+
+@app.post("/cache/clear")
+async def cache_clear(analyzer: WheelAnalyzer = Depends(get_analyzer)):
+    analyzer.clear_caches()
+    price_batcher.clear()
+    _chain_for.cache_clear()
+    return {"success": True, "detail": "caches cleared"}
+
+
+if __name__ == "__main__":
+    # Import string (not the app object) so uvicorn can fork workers;
+    # loop/http "auto" picks up uvloop and httptools when installed
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=os.cpu_count(),
+        loop="auto",
+        http="auto",
+    )
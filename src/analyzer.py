@@ -3,14 +3,48 @@ Main wheel strategy analyzer
 """
 
 from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+import functools
 import logging
+import threading
+import time
+import numpy as np
 import pandas as pd
+import requests
+import yfinance as yf
+from src.http import SESSION
 from src.options_chain import OptionsChain
 from src.calculator import ReturnCalculator
 from src.screener import StockScreener
 from src.utils import load_config, calculate_days_to_expiration
 
 
+def _column_or_default(df: pd.DataFrame, column: str, default: float = 0.0) -> np.ndarray:
+    """Return a column as a float64 NumPy array, or a default-filled array if missing."""
+    if column in df.columns:
+        return df[column].fillna(default).to_numpy(dtype=np.float64)
+    return np.full(len(df), default, dtype=np.float64)
+
+
+def _resolve_premiums(df: pd.DataFrame) -> pd.Series:
+    """
+    Resolve per-share premiums in one vectorized pass.
+
+    Uses the bid where it is positive, falls back to lastPrice for missing
+    or zero bids, and defaults to 0 when neither column is present.
+    """
+    bid = df.get('bid')
+    last = df.get('lastPrice')
+    if bid is None:
+        if last is None:
+            return pd.Series(0.0, index=df.index)
+        return last.fillna(0)
+
+    fallback = last if last is not None else pd.Series(0.0, index=df.index)
+    return bid.mask(bid.le(0) | bid.isna(), fallback).fillna(0)
+
+
 class WheelAnalyzer:
     """
     Main analyzer for wheel strategy opportunities.
@@ -29,6 +63,27 @@ class WheelAnalyzer:
         )
         self.screener = StockScreener(self.config)
         self.logger = logging.getLogger(__name__)
+        # Guards screening_criteria mutation when serving concurrent requests
+        self._criteria_lock = threading.Lock()
+        # 15-minute buckets of the default screen, keyed by int(time // 900)
+        self._screen_cache: Dict[int, pd.DataFrame] = {}
+
+    def prewarm(self) -> None:
+        """
+        Trigger the one-time numba compilations with tiny throwaway inputs.
+
+        Called from server startup so the first real request doesn't pay
+        JIT cost; harmless (just arithmetic) when numba is absent.
+        """
+        self.calculator.calculate_put_return_vec(
+            100.0, np.array([95.0]), np.array([1.0]), 30
+        )
+        self.calculator.calculate_call_return_vec(
+            100.0, np.array([105.0]), np.array([1.0]), 98.0, 30
+        )
+        self.calculator.calculate_wheel_cycle_return(
+            100.0, 95.0, 1.0, 105.0, 1.0, 30, 30, assignment_assumed=True
+        )
 
     def screen_stocks(
         self,
@@ -49,33 +104,65 @@ class WheelAnalyzer:
         Returns:
             DataFrame with screening results
         """
-        # Update screening criteria if provided
-        if min_market_cap:
-            self.screener.screening_criteria['min_market_cap'] = min_market_cap
-        if min_iv_rank:
-            self.screener.screening_criteria['min_iv_rank'] = min_iv_rank
-        if min_options_volume:
-            self.screener.screening_criteria['min_options_volume'] = min_options_volume
-
-        # Run screening
-        if tickers:
-            results = self.screener.screen_multiple_tickers(tickers)
-        else:
-            results = self.screener.run_default_screen()
+        # The default screen (no explicit tickers, no criteria overrides) is
+        # deterministic within a 15-minute window, so cache it per bucket.
+        use_cache = tickers is None and not (min_market_cap or min_iv_rank or min_options_volume)
+        bucket = int(time.time() // 900)
+        if use_cache:
+            cached = self._screen_cache.get(bucket)
+            if cached is not None:
+                return cached
+
+        with self._criteria_lock:
+            # Update screening criteria if provided
+            if min_market_cap:
+                self.screener.screening_criteria['min_market_cap'] = min_market_cap
+            if min_iv_rank:
+                self.screener.screening_criteria['min_iv_rank'] = min_iv_rank
+            if min_options_volume:
+                self.screener.screening_criteria['min_options_volume'] = min_options_volume
+
+            # Run screening
+            if tickers:
+                results = self.screener.screen_multiple_tickers(tickers)
+            else:
+                results = self.screener.run_default_screen()
 
         # Rank results
         if not results.empty:
             results = self.screener.rank_candidates(results)
+            # Dictionary-encoded tickers: int codes instead of one Python
+            # string object per row
+            results['ticker'] = results['ticker'].astype('category')
+
+        if use_cache:
+            self._screen_cache[bucket] = results
+            # Evict stale buckets so the cache never grows past two entries
+            for old in [b for b in self._screen_cache if b < bucket - 1]:
+                del self._screen_cache[old]
 
         return results
 
-    def analyze_ticker(self, ticker: str, target_dte: Optional[int] = None) -> 'TickerAnalysis':
+    def clear_caches(self) -> None:
+        """Drop all cached screens, analyses and universe metadata (manual
+        invalidation)."""
+        self._screen_cache.clear()
+        self._get_analysis.cache_clear()
+        self.screener._load_universe_cached.cache_clear()
+
+    def analyze_ticker(
+        self,
+        ticker: str,
+        target_dte: Optional[int] = None,
+        prefetched_price: Optional[float] = None
+    ) -> 'TickerAnalysis':
         """
         Perform comprehensive analysis on a specific ticker.
 
         Args:
             ticker: Stock ticker symbol
             target_dte: Target days to expiration (uses config default if not provided)
+            prefetched_price: Current price from a bulk quote download
 
         Returns:
             TickerAnalysis object with analysis results
@@ -83,13 +170,118 @@ class WheelAnalyzer:
         if target_dte is None:
             target_dte = self.config.get('strategy', {}).get('put_selling', {}).get('preferred_dte', 30)
 
+        if prefetched_price is not None:
+            # The caller holds a fresher quote than a cache bucket guarantees;
+            # construct directly rather than routing through the LRU.
+            return TickerAnalysis(
+                ticker, self.config, self.calculator, target_dte,
+                prefetched_price=prefetched_price
+            )
+
+        # Bucket by minute so repeat requests within the same minute reuse the
+        # already-fetched analysis; stale buckets fall out of the LRU naturally.
+        return self._get_analysis(ticker, target_dte, int(time.time() // 60))
+
+    @functools.lru_cache(maxsize=512)
+    def _get_analysis(self, ticker: str, target_dte: int, minute_bucket: int) -> 'TickerAnalysis':
+        """
+        Build (or return a cached) TickerAnalysis.
+
+        Args:
+            ticker: Stock ticker symbol
+            target_dte: Target days to expiration
+            minute_bucket: Current minute (cache key component for freshness)
+
+        Returns:
+            TickerAnalysis object
+        """
         return TickerAnalysis(ticker, self.config, self.calculator, target_dte)
 
+    def _prefetch(self, tickers: List[str]) -> Dict[str, float]:
+        """
+        Fetch current prices for a ticker list with one bulk download.
+
+        Chains and expirations still fetch per ticker (yfinance exposes no
+        bulk endpoint for them), but the per-ticker price lookup inside each
+        analysis is skipped for every symbol the download covers.
+
+        Args:
+            tickers: List of ticker symbols
+
+        Returns:
+            Dictionary mapping upper-cased symbols to their latest close
+        """
+        try:
+            quotes = yf.download(
+                " ".join(tickers),
+                period="1d",
+                interval="1d",
+                group_by="ticker",
+                progress=False,
+                session=SESSION,
+            )
+        except Exception as e:
+            self.logger.error(f"Bulk price prefetch failed, falling back to per-ticker fetches: {e}")
+            return {}
+
+        prices: Dict[str, float] = {}
+        if quotes is None or quotes.empty:
+            return prices
+        for ticker in tickers:
+            symbol = ticker.upper()
+            try:
+                closes = quotes[symbol]['Close'].dropna()
+            except KeyError:
+                continue
+            if not closes.empty:
+                prices[symbol] = float(closes.iloc[-1])
+        return prices
+
+    def best_opportunity(
+        self,
+        ticker: str,
+        strategy: str = 'put',
+        target_dte: Optional[int] = None,
+        prefetched_price: Optional[float] = None
+    ) -> Optional[Dict]:
+        """
+        Analyze one ticker and return its single best opportunity row.
+
+        Args:
+            ticker: Stock ticker symbol
+            strategy: 'put' or 'call'
+            target_dte: Target days to expiration
+            prefetched_price: Current price from a bulk quote download
+
+        Returns:
+            Dictionary describing the best strike, or None if nothing qualifies
+        """
+        analysis = self.analyze_ticker(ticker, target_dte, prefetched_price=prefetched_price)
+
+        if strategy.lower() == 'put':
+            opportunities = analysis.get_put_opportunities(top_k=1)
+        else:
+            opportunities = analysis.get_call_opportunities(top_k=1)
+
+        if opportunities.empty:
+            return None
+
+        best = opportunities.iloc[0]
+        return {
+            'ticker': ticker,
+            'strike': best.get('strike'),
+            'premium': best.get('bid', 0),
+            'return_pct': best.get('return_pct', 0),
+            'annualized_return': best.get('annualized_return', 0),
+            'dte': best.get('dte', 0)
+        }
+
     def compare_opportunities(
         self,
         tickers: List[str],
         strategy: str = 'put',
-        target_dte: Optional[int] = None
+        target_dte: Optional[int] = None,
+        top_k: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Compare wheel strategy opportunities across multiple tickers.
@@ -98,39 +290,60 @@ class WheelAnalyzer:
             tickers: List of ticker symbols
             strategy: 'put' or 'call'
             target_dte: Target days to expiration
+            top_k: Return only the k best rows (partial heap selection
+                instead of a full sort)
 
         Returns:
             DataFrame comparing opportunities
         """
-        results = []
+        # One bulk download fetches every quote for the batch up front
+        prefetched = self._prefetch(tickers)
 
-        for ticker in tickers:
-            try:
-                analysis = self.analyze_ticker(ticker, target_dte)
-
-                if strategy.lower() == 'put':
-                    opportunities = analysis.get_put_opportunities()
-                else:
-                    opportunities = analysis.get_call_opportunities()
-
-                if not opportunities.empty:
-                    best = opportunities.iloc[0]
-                    results.append({
-                        'ticker': ticker,
-                        'strike': best.get('strike'),
-                        'premium': best.get('bid', 0),
-                        'return_pct': best.get('return_pct', 0),
-                        'annualized_return': best.get('annualized_return', 0),
-                        'dte': best.get('dte', 0)
-                    })
-            except Exception as e:
-                self.logger.error(f"Error analyzing {ticker}: {e}")
-                continue
+        def _one(ticker: str) -> Optional[Dict]:
+            return self.best_opportunity(
+                ticker, strategy, target_dte,
+                prefetched_price=prefetched.get(ticker.upper())
+            )
 
-        if not results:
+        # Ticker fetches are I/O-bound (yfinance), so overlap them in a thread pool.
+        # Errors are checked per future so one bad ticker doesn't poison the batch.
+        # Results accumulate column-wise so the final frame is built without
+        # per-row dict boxing or dtype inference.
+        max_workers = self.config.get('io', {}).get('max_workers', 8)
+        columns: Dict[str, list] = {
+            'ticker': [], 'strike': [], 'premium': [],
+            'return_pct': [], 'annualized_return': [], 'dte': []
+        }
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_one, ticker): ticker for ticker in tickers}
+            for future in as_completed(futures):
+                ticker = futures[future]
+                exc = future.exception()
+                if exc is not None:
+                    # Network and data-shape errors are expected per ticker;
+                    # anything else is a programmer bug and should propagate
+                    if isinstance(exc, (requests.RequestException, KeyError, ValueError)):
+                        self.logger.error(f"Error analyzing {ticker}: {exc}")
+                        continue
+                    raise exc
+                row = future.result()
+                if row:
+                    for key, value in row.items():
+                        columns[key].append(value)
+
+        if not columns['ticker']:
             return pd.DataFrame()
 
-        df = pd.DataFrame(results)
+        df = pd.DataFrame({
+            'ticker': pd.Categorical(columns['ticker']),
+            'strike': np.asarray(columns['strike'], dtype=np.float64),
+            'premium': np.asarray(columns['premium'], dtype=np.float64),
+            'return_pct': np.asarray(columns['return_pct'], dtype=np.float64),
+            'annualized_return': np.asarray(columns['annualized_return'], dtype=np.float64),
+            'dte': np.asarray(columns['dte'], dtype=np.int64)
+        })
+        if top_k is not None:
+            return df.nlargest(top_k, 'annualized_return')
         return df.sort_values('annualized_return', ascending=False)
 
     def find_best_wheel_candidates(
@@ -155,9 +368,12 @@ class WheelAnalyzer:
             self.logger.warning("No stocks passed screening")
             return pd.DataFrame()
 
-        # Analyze top candidates
+        # Analyze top candidates; keep 2x max_results so the return filter
+        # below still has room to discard rows
         top_tickers = screened.head(20)['ticker'].tolist()
-        opportunities = self.compare_opportunities(top_tickers, strategy='put')
+        opportunities = self.compare_opportunities(
+            top_tickers, strategy='put', top_k=max_results * 2
+        )
 
         if opportunities.empty:
             return pd.DataFrame()
@@ -178,7 +394,8 @@ class TickerAnalysis:
         ticker: str,
         config: Dict,
         calculator: ReturnCalculator,
-        target_dte: int = 30
+        target_dte: int = 30,
+        prefetched_price: Optional[float] = None
     ):
         """
         Initialize ticker analysis.
@@ -188,6 +405,7 @@ class TickerAnalysis:
             config: Configuration dictionary
             calculator: ReturnCalculator instance
             target_dte: Target days to expiration
+            prefetched_price: Current price from a bulk quote download
         """
         self.ticker = ticker
         self.config = config
@@ -195,14 +413,30 @@ class TickerAnalysis:
         self.target_dte = target_dte
         self.logger = logging.getLogger(__name__)
 
-        self.options_chain = OptionsChain(ticker)
+        self.options_chain = OptionsChain(ticker, price=prefetched_price)
         self.current_price = self.options_chain.get_current_price()
         self.expiration_date = self.options_chain.find_nearest_expiration(target_dte)
+        self._chain: Optional[Tuple[pd.DataFrame, pd.DataFrame]] = None
+
+        # Parse the expiration once; every opportunity call reuses the same DTE
+        if self.expiration_date:
+            self._exp_dt = datetime.strptime(self.expiration_date, '%Y-%m-%d')
+            self.dte = calculate_days_to_expiration(self._exp_dt)
+        else:
+            self._exp_dt = None
+            self.dte = None
+
+    def _get_chain(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Fetch (calls, puts) for the target expiration once and reuse it."""
+        if self._chain is None:
+            self._chain = self.options_chain.get_options_chain(self.expiration_date)
+        return self._chain
 
     def get_put_opportunities(
         self,
         delta_range: Optional[Tuple[float, float]] = None,
-        min_premium: Optional[float] = None
+        min_premium: Optional[float] = None,
+        top_k: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Get cash-secured put selling opportunities.
@@ -210,6 +444,8 @@ class TickerAnalysis:
         Args:
             delta_range: Tuple of (min_delta, max_delta)
             min_premium: Minimum premium per share
+            top_k: Return only the k best strikes (partial heap selection
+                instead of a full sort)
 
         Returns:
             DataFrame with put opportunities
@@ -229,63 +465,71 @@ class TickerAnalysis:
             min_premium = put_config.get('min_premium_pct', 1.0) * self.current_price / 100
 
         # Get puts
-        _, puts = self.options_chain.get_options_chain(self.expiration_date)
+        _, puts = self._get_chain()
 
         if puts.empty:
             return pd.DataFrame()
 
-        # Calculate days to expiration
-        from datetime import datetime
-        exp_date = datetime.strptime(self.expiration_date, '%Y-%m-%d')
-        dte = calculate_days_to_expiration(exp_date)
+        dte = self.dte
 
-        # Enhance with return calculations
-        results = []
-        for _, row in puts.iterrows():
-            strike = row['strike']
-            premium = row.get('bid', row.get('lastPrice', 0))
+        # Resolve premiums once, then apply the OTM and premium-floor filters
+        # as one fused query expression (numexpr-backed when available)
+        premium_col = _resolve_premiums(puts)
 
-            if premium < min_premium:
-                continue
+        current = self.current_price
+        filtered = puts.assign(_premium=premium_col).query(
+            'strike < @current and _premium >= @min_premium'
+        )
+        if filtered.empty:
+            return pd.DataFrame()
 
-            # Filter for OTM puts (strike below current price)
-            if strike >= self.current_price:
-                continue
+        strikes = filtered['strike'].to_numpy()
+        premiums = filtered['_premium'].to_numpy()
 
-            # Calculate returns
-            returns = self.calculator.calculate_put_return(
-                self.current_price,
-                strike,
-                premium,
-                dte
-            )
+        # Vectorized return calculations over the whole filtered chain
+        returns = self.calculator.calculate_put_return_vec(
+            self.current_price,
+            strikes,
+            premiums,
+            dte
+        )
 
-            results.append({
-                'strike': strike,
-                'premium': premium,
-                'bid': row.get('bid', 0),
-                'ask': row.get('ask', 0),
-                'volume': row.get('volume', 0),
-                'open_interest': row.get('openInterest', 0),
-                'implied_volatility': row.get('impliedVolatility', 0),
-                'dte': dte,
-                'return_pct': returns['return_pct'],
-                'annualized_return': returns['annualized_return'],
-                'breakeven': returns['breakeven_price'],
-                'downside_protection': returns['downside_protection_pct']
-            })
-
-        if not results:
-            return pd.DataFrame()
+        # Probability/EV metrics come from the same whole-column arrays;
+        # max loss assumes the breakeven rides to zero (cash-secured put)
+        implied_vols = _column_or_default(filtered, 'impliedVolatility')
+        pop = self.calculator.calculate_probability_of_profit_vec(
+            self.current_price, returns['breakeven_price'], implied_vols, dte
+        )
+        expected_values = self.calculator.calculate_expected_value_vec(
+            premiums, returns['breakeven_price'], pop
+        )
 
-        df = pd.DataFrame(results)
+        df = pd.DataFrame({
+            'strike': strikes,
+            'premium': premiums,
+            'bid': _column_or_default(filtered, 'bid'),
+            'ask': _column_or_default(filtered, 'ask'),
+            'volume': _column_or_default(filtered, 'volume'),
+            'open_interest': _column_or_default(filtered, 'openInterest'),
+            'implied_volatility': implied_vols,
+            'dte': np.full(len(filtered), dte, dtype=np.int64),
+            'return_pct': returns['return_pct'],
+            'annualized_return': returns['annualized_return'],
+            'breakeven': returns['breakeven_price'],
+            'downside_protection': returns['downside_protection_pct'],
+            'probability_of_profit': pop,
+            'expected_value': expected_values
+        })
+        if top_k is not None:
+            return df.nlargest(top_k, 'annualized_return')
         return df.sort_values('annualized_return', ascending=False)
 
     def get_call_opportunities(
         self,
         delta_range: Optional[Tuple[float, float]] = None,
         min_premium: Optional[float] = None,
-        cost_basis: Optional[float] = None
+        cost_basis: Optional[float] = None,
+        top_k: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Get covered call selling opportunities.
@@ -294,6 +538,8 @@ class TickerAnalysis:
             delta_range: Tuple of (min_delta, max_delta)
             min_premium: Minimum premium per share
             cost_basis: Your cost basis (defaults to current price)
+            top_k: Return only the k best strikes (partial heap selection
+                instead of a full sort)
 
         Returns:
             DataFrame with call opportunities
@@ -316,58 +562,53 @@ class TickerAnalysis:
             min_premium = call_config.get('min_premium_pct', 0.5) * self.current_price / 100
 
         # Get calls
-        calls, _ = self.options_chain.get_options_chain(self.expiration_date)
+        calls, _ = self._get_chain()
 
         if calls.empty:
             return pd.DataFrame()
 
-        # Calculate days to expiration
-        from datetime import datetime
-        exp_date = datetime.strptime(self.expiration_date, '%Y-%m-%d')
-        dte = calculate_days_to_expiration(exp_date)
+        dte = self.dte
 
-        # Enhance with return calculations
-        results = []
-        for _, row in calls.iterrows():
-            strike = row['strike']
-            premium = row.get('bid', row.get('lastPrice', 0))
+        # Resolve premiums once, then apply the OTM and premium-floor filters
+        # as one fused query expression (numexpr-backed when available)
+        premium_col = _resolve_premiums(calls)
 
-            if premium < min_premium:
-                continue
-
-            # Filter for OTM calls (strike above current price)
-            if strike <= self.current_price:
-                continue
+        current = self.current_price
+        filtered = calls.assign(_premium=premium_col).query(
+            'strike > @current and _premium >= @min_premium'
+        )
+        if filtered.empty:
+            return pd.DataFrame()
 
-            # Calculate returns
-            returns = self.calculator.calculate_call_return(
-                self.current_price,
-                strike,
-                premium,
-                cost_basis,
-                dte
-            )
+        strikes = filtered['strike'].to_numpy()
+        premiums = filtered['_premium'].to_numpy()
 
-            results.append({
-                'strike': strike,
-                'premium': premium,
-                'bid': row.get('bid', 0),
-                'ask': row.get('ask', 0),
-                'volume': row.get('volume', 0),
-                'open_interest': row.get('openInterest', 0),
-                'implied_volatility': row.get('impliedVolatility', 0),
-                'dte': dte,
-                'premium_return_pct': returns['premium_return_pct'],
-                'total_return_pct': returns['total_return_pct'],
-                'annualized_return': returns['annualized_return'],
-                'max_profit_price': returns['max_profit_price'],
-                'upside_capture': returns['upside_capture_pct']
-            })
-
-        if not results:
-            return pd.DataFrame()
+        # Vectorized return calculations over the whole filtered chain
+        returns = self.calculator.calculate_call_return_vec(
+            self.current_price,
+            strikes,
+            premiums,
+            cost_basis,
+            dte
+        )
 
-        df = pd.DataFrame(results)
+        df = pd.DataFrame({
+            'strike': strikes,
+            'premium': premiums,
+            'bid': _column_or_default(filtered, 'bid'),
+            'ask': _column_or_default(filtered, 'ask'),
+            'volume': _column_or_default(filtered, 'volume'),
+            'open_interest': _column_or_default(filtered, 'openInterest'),
+            'implied_volatility': _column_or_default(filtered, 'impliedVolatility'),
+            'dte': np.full(len(filtered), dte, dtype=np.int64),
+            'premium_return_pct': returns['premium_return_pct'],
+            'total_return_pct': returns['total_return_pct'],
+            'annualized_return': returns['annualized_return'],
+            'max_profit_price': returns['max_profit_price'],
+            'upside_capture': returns['upside_capture_pct']
+        })
+        if top_k is not None:
+            return df.nlargest(top_k, 'annualized_return')
         return df.sort_values('annualized_return', ascending=False)
 
     def get_wheel_cycle_analysis(
@@ -391,30 +632,24 @@ class TickerAnalysis:
         if call_strike is None:
             call_strike = self.current_price * 1.05
 
-        # Get put and call chains
-        _, puts = self.options_chain.get_options_chain(self.expiration_date)
-        calls, _ = self.options_chain.get_options_chain(self.expiration_date)
+        # Get put and call chains in a single fetch
+        calls, puts = self._get_chain()
 
         if puts.empty or calls.empty:
             return {}
 
-        # Find closest strikes
-        put_option = puts.iloc[(puts['strike'] - put_strike).abs().argsort()[:1]]
-        call_option = calls.iloc[(calls['strike'] - call_strike).abs().argsort()[:1]]
-
-        if put_option.empty or call_option.empty:
-            return {}
+        # Find closest strikes with a single O(N) reduction per side
+        put_row = puts.loc[(puts['strike'] - put_strike).abs().idxmin()]
+        call_row = calls.loc[(calls['strike'] - call_strike).abs().idxmin()]
 
         # Get premiums
-        put_premium = put_option.iloc[0].get('bid', 0)
-        call_premium = call_option.iloc[0].get('bid', 0)
-        actual_put_strike = put_option.iloc[0]['strike']
-        actual_call_strike = call_option.iloc[0]['strike']
+        put_premium = put_row.get('bid', 0)
+        call_premium = call_row.get('bid', 0)
+        actual_put_strike = put_row['strike']
+        actual_call_strike = call_row['strike']
 
         # Calculate cycle returns
-        from datetime import datetime
-        exp_date = datetime.strptime(self.expiration_date, '%Y-%m-%d')
-        dte = calculate_days_to_expiration(exp_date)
+        dte = self.dte
 
         cycle_returns = self.calculator.calculate_wheel_cycle_return(
             self.current_price,
@@ -4,6 +4,140 @@ Return calculations for wheel strategy options
 
 from typing import Dict, Tuple, Optional
 import logging
+import math
+import numpy as np
+from scipy.special import ndtr
+
+# Hoisted constant: multiply instead of dividing by 365 in hot paths
+_INV_365 = 1.0 / 365.0
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+    prange = range
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _put_returns(stock_price, strikes, premiums, days_to_expiration, contract_size):
+    """Compiled per-strike put return math over contiguous float32 arrays."""
+    n = strikes.shape[0]
+    capital_required = np.empty(n, dtype=np.float32)
+    total_premium = np.empty(n, dtype=np.float32)
+    return_pct = np.empty(n, dtype=np.float32)
+    annualized_return = np.empty(n, dtype=np.float32)
+    breakeven = np.empty(n, dtype=np.float32)
+    downside_protection_pct = np.empty(n, dtype=np.float32)
+
+    periods_per_year = 365.0 / days_to_expiration if days_to_expiration > 0 else 0.0
+    # Iterations are independent, so the strike axis splits across cores
+    for i in prange(n):
+        capital_required[i] = strikes[i] * contract_size
+        total_premium[i] = premiums[i] * contract_size
+        return_pct[i] = (total_premium[i] / capital_required[i]) * 100.0
+        if days_to_expiration > 0:
+            annualized_return[i] = math.expm1(math.log1p(return_pct[i] * 0.01) * periods_per_year) * 100.0
+        else:
+            annualized_return[i] = 0.0
+        breakeven[i] = strikes[i] - premiums[i]
+        downside_protection_pct[i] = (premiums[i] / stock_price) * 100.0
+
+    return capital_required, total_premium, return_pct, annualized_return, breakeven, downside_protection_pct
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _call_returns(stock_price, strikes, premiums, cost_basis, days_to_expiration, contract_size):
+    """Compiled per-strike covered call return math over contiguous float32 arrays."""
+    n = strikes.shape[0]
+    total_premium = np.empty(n, dtype=np.float32)
+    capital_gain = np.empty(n, dtype=np.float32)
+    total_return = np.empty(n, dtype=np.float32)
+    premium_return_pct = np.empty(n, dtype=np.float32)
+    total_return_pct = np.empty(n, dtype=np.float32)
+    annualized_return = np.empty(n, dtype=np.float32)
+    max_profit_price = np.empty(n, dtype=np.float32)
+    upside_capture_pct = np.empty(n, dtype=np.float32)
+
+    capital_invested = cost_basis * contract_size
+    periods_per_year = 365.0 / days_to_expiration if days_to_expiration > 0 else 0.0
+    # Iterations are independent, so the strike axis splits across cores
+    for i in prange(n):
+        total_premium[i] = premiums[i] * contract_size
+        gain = (strikes[i] - cost_basis) * contract_size
+        capital_gain[i] = gain if gain > 0.0 else 0.0
+        total_return[i] = total_premium[i] + capital_gain[i]
+        premium_return_pct[i] = (total_premium[i] / capital_invested) * 100.0
+        total_return_pct[i] = (total_return[i] / capital_invested) * 100.0
+        if days_to_expiration > 0:
+            annualized_return[i] = math.expm1(math.log1p(total_return_pct[i] * 0.01) * periods_per_year) * 100.0
+        else:
+            annualized_return[i] = 0.0
+        max_profit_price[i] = strikes[i] + premiums[i]
+        upside_capture_pct[i] = ((max_profit_price[i] - stock_price) / stock_price) * 100.0
+
+    return (total_premium, capital_gain, total_return, premium_return_pct,
+            total_return_pct, annualized_return, max_profit_price, upside_capture_pct)
+
+
+@njit(fastmath=True, cache=True)
+def _put_return_core(stock_price, strike_price, premium, days_to_expiration, contract_size):
+    """Compiled scalar core of the cash-secured put return math."""
+    capital_required = strike_price * contract_size
+    total_premium = premium * contract_size
+    return_pct = (total_premium / capital_required) * 100.0
+    if days_to_expiration > 0:
+        # expm1/log1p is cheaper and less noisy than (1+x)**p - 1 for small x
+        periods_per_year = 365.0 / days_to_expiration
+        annualized_return = math.expm1(math.log1p(return_pct * 0.01) * periods_per_year) * 100.0
+    else:
+        annualized_return = 0.0
+    breakeven = strike_price - premium
+    downside_protection_pct = (premium / stock_price) * 100.0
+    return (capital_required, total_premium, return_pct, annualized_return,
+            breakeven, downside_protection_pct)
+
+
+@njit(fastmath=True, cache=True)
+def _call_return_core(stock_price, strike_price, premium, cost_basis, days_to_expiration, contract_size):
+    """Compiled scalar core of the covered call return math."""
+    capital_invested = cost_basis * contract_size
+    total_premium = premium * contract_size
+    premium_return_pct = (total_premium / capital_invested) * 100.0
+    if strike_price > cost_basis:
+        capital_gain = (strike_price - cost_basis) * contract_size
+    else:
+        capital_gain = 0.0
+    total_return = total_premium + capital_gain
+    total_return_pct = (total_return / capital_invested) * 100.0
+    if days_to_expiration > 0:
+        periods_per_year = 365.0 / days_to_expiration
+        annualized_return = math.expm1(math.log1p(total_return_pct * 0.01) * periods_per_year) * 100.0
+    else:
+        annualized_return = 0.0
+    max_profit_price = strike_price + premium
+    upside_capture_pct = ((max_profit_price - stock_price) / stock_price) * 100.0
+    return (capital_invested, total_premium, capital_gain, total_return,
+            premium_return_pct, total_return_pct, annualized_return,
+            upside_capture_pct, max_profit_price)
+
+
+@njit(fastmath=True, cache=True)
+def _wheel_cycle_core(put_strike, put_premium, call_premium, put_dte, call_dte, contract_size):
+    """Compiled totals for a full put-then-call wheel cycle."""
+    total_premium = (put_premium + call_premium) * contract_size
+    total_days = put_dte + call_dte
+    capital_required = put_strike * contract_size
+    total_return_pct = (total_premium / capital_required) * 100.0
+    if total_days > 0:
+        periods_per_year = 365.0 / total_days
+        annualized_cycle_return = math.expm1(math.log1p(total_return_pct * 0.01) * periods_per_year) * 100.0
+    else:
+        annualized_cycle_return = 0.0
+    return total_premium, total_return_pct, annualized_cycle_return, total_days, capital_required
 
 
 class ReturnCalculator:
@@ -42,27 +176,52 @@ class ReturnCalculator:
         Returns:
             Dictionary with return metrics
         """
-        # Capital required (cash secured)
-        capital_required = strike_price * contract_size
-
-        # Total premium received
-        total_premium = premium * contract_size
+        (capital_required, total_premium, return_pct, annualized_return,
+         breakeven, downside_protection_pct) = _put_return_core(
+            float(stock_price), float(strike_price), float(premium),
+            int(days_to_expiration), contract_size
+        )
 
-        # Return on capital
-        return_pct = (total_premium / capital_required) * 100
+        return {
+            'capital_required': capital_required,
+            'premium_received': total_premium,
+            'return_pct': return_pct,
+            'annualized_return': annualized_return,
+            'breakeven_price': breakeven,
+            'downside_protection_pct': downside_protection_pct,
+            'days_to_expiration': days_to_expiration
+        }
 
-        # Annualized return
-        if days_to_expiration > 0:
-            periods_per_year = 365.0 / days_to_expiration
-            annualized_return = ((1 + return_pct / 100) ** periods_per_year - 1) * 100
-        else:
-            annualized_return = 0.0
+    def calculate_put_return_vec(
+        self,
+        stock_price: float,
+        strikes: np.ndarray,
+        premiums: np.ndarray,
+        days_to_expiration: int,
+        contract_size: int = 100
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized companion to calculate_put_return for whole option chains.
 
-        # Break-even price
-        breakeven = strike_price - premium
+        Args:
+            stock_price: Current stock price
+            strikes: Array of put strike prices
+            premiums: Array of premiums received per share
+            days_to_expiration: Days until expiration
+            contract_size: Shares per contract (default 100)
 
-        # Downside protection
-        downside_protection_pct = (premium / stock_price) * 100
+        Returns:
+            Dictionary with arrays of return metrics (one entry per strike)
+        """
+        # float32 halves memory traffic and doubles SIMD width; option display
+        # math needs at most 6-7 significant figures
+        strikes = np.ascontiguousarray(strikes, dtype=np.float32)
+        premiums = np.ascontiguousarray(premiums, dtype=np.float32)
+
+        (capital_required, total_premium, return_pct, annualized_return,
+         breakeven, downside_protection_pct) = _put_returns(
+            float(stock_price), strikes, premiums, int(days_to_expiration), contract_size
+        )
 
         return {
             'capital_required': capital_required,
@@ -70,8 +229,7 @@ class ReturnCalculator:
             'return_pct': return_pct,
             'annualized_return': annualized_return,
             'breakeven_price': breakeven,
-            'downside_protection_pct': downside_protection_pct,
-            'days_to_expiration': days_to_expiration
+            'downside_protection_pct': downside_protection_pct
         }
 
     def calculate_call_return(
@@ -97,38 +255,59 @@ class ReturnCalculator:
         Returns:
             Dictionary with return metrics
         """
-        # Capital at risk (stock value at cost basis)
-        capital_invested = cost_basis * contract_size
-
-        # Total premium received
-        total_premium = premium * contract_size
+        (capital_invested, total_premium, capital_gain, total_return,
+         premium_return_pct, total_return_pct, annualized_return,
+         upside_capture_pct, max_profit_price) = _call_return_core(
+            float(stock_price), float(strike_price), float(premium),
+            float(cost_basis), int(days_to_expiration), contract_size
+        )
 
-        # Return on capital from premium only
-        premium_return_pct = (total_premium / capital_invested) * 100
+        return {
+            'capital_invested': capital_invested,
+            'premium_received': total_premium,
+            'potential_capital_gain': capital_gain,
+            'total_return': total_return,
+            'premium_return_pct': premium_return_pct,
+            'total_return_pct': total_return_pct,
+            'annualized_return': annualized_return,
+            'upside_capture_pct': upside_capture_pct,
+            'max_profit_price': max_profit_price,
+            'days_to_expiration': days_to_expiration
+        }
 
-        # Potential capital gain if called away
-        if strike_price > cost_basis:
-            capital_gain = (strike_price - cost_basis) * contract_size
-            total_return = total_premium + capital_gain
-        else:
-            capital_gain = 0
-            total_return = total_premium
+    def calculate_call_return_vec(
+        self,
+        stock_price: float,
+        strikes: np.ndarray,
+        premiums: np.ndarray,
+        cost_basis: float,
+        days_to_expiration: int,
+        contract_size: int = 100
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized companion to calculate_call_return for whole option chains.
 
-        total_return_pct = (total_return / capital_invested) * 100
+        Args:
+            stock_price: Current stock price
+            strikes: Array of call strike prices
+            premiums: Array of premiums received per share
+            cost_basis: Your cost basis in the stock
+            days_to_expiration: Days until expiration
+            contract_size: Shares per contract (default 100)
 
-        # Annualized returns
-        if days_to_expiration > 0:
-            periods_per_year = 365.0 / days_to_expiration
-            annualized_return = ((1 + total_return_pct / 100) ** periods_per_year - 1) * 100
-        else:
-            annualized_return = 0.0
+        Returns:
+            Dictionary with arrays of return metrics (one entry per strike)
+        """
+        strikes = np.ascontiguousarray(strikes, dtype=np.float32)
+        premiums = np.ascontiguousarray(premiums, dtype=np.float32)
 
-        # Upside capture
-        max_profit_price = strike_price + premium
-        upside_capture_pct = ((max_profit_price - stock_price) / stock_price) * 100
+        (total_premium, capital_gain, total_return, premium_return_pct,
+         total_return_pct, annualized_return, max_profit_price, upside_capture_pct) = _call_returns(
+            float(stock_price), strikes, premiums, float(cost_basis),
+            int(days_to_expiration), contract_size
+        )
 
         return {
-            'capital_invested': capital_invested,
             'premium_received': total_premium,
             'potential_capital_gain': capital_gain,
             'total_return': total_return,
@@ -136,8 +315,7 @@ class ReturnCalculator:
             'total_return_pct': total_return_pct,
             'annualized_return': annualized_return,
             'upside_capture_pct': upside_capture_pct,
-            'max_profit_price': max_profit_price,
-            'days_to_expiration': days_to_expiration
+            'max_profit_price': max_profit_price
         }
 
     def calculate_wheel_cycle_return(
@@ -185,18 +363,12 @@ class ReturnCalculator:
                 call_dte
             )
 
-            # Total cycle metrics
-            total_premium = put_returns['premium_received'] + call_returns['premium_received']
-            total_days = put_dte + call_dte
-            capital_required = put_strike * 100
-
-            total_return_pct = (total_premium / capital_required) * 100
-
-            if total_days > 0:
-                periods_per_year = 365.0 / total_days
-                annualized_cycle_return = ((1 + total_return_pct / 100) ** periods_per_year - 1) * 100
-            else:
-                annualized_cycle_return = 0.0
+            # Total cycle metrics via the compiled core
+            (total_premium, total_return_pct, annualized_cycle_return,
+             total_days, capital_required) = _wheel_cycle_core(
+                float(put_strike), float(put_premium), float(call_premium),
+                int(put_dte), int(call_dte), 100
+            )
 
             return {
                 'put_phase': put_returns,
@@ -260,24 +432,86 @@ class ReturnCalculator:
         Returns:
             Probability of profit (0-1)
         """
-        import math
-        from scipy.stats import norm
-
         if days_to_expiration <= 0:
             return 1.0 if stock_price >= breakeven_price else 0.0
 
         # Adjust IV for time period
-        time_fraction = days_to_expiration / 365.0
+        time_fraction = days_to_expiration * _INV_365
         expected_move = stock_price * implied_volatility * math.sqrt(time_fraction)
 
         # Z-score
         z_score = (stock_price - breakeven_price) / expected_move if expected_move > 0 else 0
 
-        # Probability using normal distribution
-        probability = norm.cdf(z_score)
+        # ndtr is the raw normal CDF, skipping the norm.cdf wrapper overhead
+        probability = float(ndtr(z_score))
 
         return probability
 
+    def calculate_probability_of_profit_vec(
+        self,
+        stock_price: float,
+        breakeven_prices: np.ndarray,
+        implied_volatilities: np.ndarray,
+        days_to_expiration: int
+    ) -> np.ndarray:
+        """
+        Vectorized companion to calculate_probability_of_profit.
+
+        Args:
+            stock_price: Current stock price
+            breakeven_prices: Array of breakeven prices
+            implied_volatilities: Array of implied volatilities (annual)
+            days_to_expiration: Days to expiration
+
+        Returns:
+            Array of profit probabilities (0-1, one entry per strike)
+        """
+        breakeven_prices = np.asarray(breakeven_prices, dtype=np.float64)
+        implied_volatilities = np.asarray(implied_volatilities, dtype=np.float64)
+
+        if days_to_expiration <= 0:
+            return (stock_price >= breakeven_prices).astype(np.float64)
+
+        time_fraction = days_to_expiration * _INV_365
+        expected_move = stock_price * implied_volatilities * math.sqrt(time_fraction)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_scores = np.where(
+                expected_move > 0,
+                (stock_price - breakeven_prices) / expected_move,
+                0.0
+            )
+
+        # ndtr is the raw normal CDF, skipping the norm.cdf wrapper overhead
+        return ndtr(z_scores)
+
+    def calculate_expected_value_vec(
+        self,
+        premiums: np.ndarray,
+        max_losses: np.ndarray,
+        probabilities: np.ndarray,
+        contract_size: int = 100
+    ) -> np.ndarray:
+        """
+        Vectorized companion to calculate_expected_value.
+
+        Args:
+            premiums: Array of premiums received per share
+            max_losses: Array of maximum losses per share
+            probabilities: Array of profit probabilities (0-1)
+            contract_size: Shares per contract
+
+        Returns:
+            Array of expected values in dollars
+        """
+        premiums = np.asarray(premiums, dtype=np.float64)
+        max_losses = np.asarray(max_losses, dtype=np.float64)
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+
+        return contract_size * (
+            probabilities * premiums - (1.0 - probabilities) * max_losses
+        )
+
     def calculate_expected_value(
         self,
         premium: float,
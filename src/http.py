@@ -0,0 +1,52 @@
+"""
+Shared HTTP session for upstream market-data requests
+"""
+
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Wide connection pool so concurrent screening threads reuse keep-alive
+# connections instead of paying a TCP+TLS handshake each, with retries on
+# transient upstream errors and rate limits
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+)
+
+try:
+    import requests_cache
+
+    # Cached session: repeat metadata requests within the expiry window are
+    # served from sqlite without touching the network. Price and chain
+    # endpoints are exempted or capped so the short-TTL caches layered above
+    # (30s price batcher, minute-bucketed analyses) actually see fresh data
+    # when their keys rotate.
+    SESSION = requests_cache.CachedSession(
+        'yf_cache',
+        backend='sqlite',
+        expire_after=300,
+        allowable_methods=('GET',),
+        urls_expire_after={
+            '*/finance/quote*': requests_cache.DO_NOT_CACHE,
+            '*/finance/chart/*': requests_cache.DO_NOT_CACHE,
+            '*/finance/options/*': 60,
+        }
+    )
+except ImportError:  # pragma: no cover - requests-cache is optional
+    # Plain session still pools connections, so TLS handshakes are paid once
+    # per host instead of once per request.
+    SESSION = requests.Session()
+    logger.debug("requests-cache not installed; using a plain pooled session")
+
+SESSION.mount('https://', _ADAPTER)
+SESSION.headers['Accept-Encoding'] = 'gzip, deflate'
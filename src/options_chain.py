@@ -3,10 +3,49 @@ Options chain data fetching and processing
 """
 
 from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import logging
+import numpy as np
 import yfinance as yf
 import pandas as pd
+from src.http import SESSION
+
+# Downstream filtering and return math only ever touch these columns, so
+# the raw yfinance frames (14+ mixed-dtype columns) are projected down on
+# fetch; float32 is plenty of precision for quotes and halves the memory
+# traffic of the hot mask/sum paths
+_CHAIN_COLUMNS = ['strike', 'bid', 'ask', 'lastPrice', 'volume', 'openInterest',
+                  'impliedVolatility', 'delta']
+_CHAIN_FLOAT32 = ('strike', 'bid', 'ask', 'lastPrice', 'impliedVolatility', 'delta')
+_CHAIN_INT32 = ('volume', 'openInterest')
+
+# Moneyness breakpoints for the rough delta estimate; searchsorted over
+# these replaces the old if/elif ladder and vectorizes over strike arrays.
+# Call thresholds are strict (>), put thresholds inclusive (<), hence the
+# differing searchsorted sides at lookup.
+_CALL_BREAKS = np.array([0.95, 1.0, 1.1])
+_CALL_DELTAS = np.array([0.15, 0.30, 0.50, 0.75])
+_PUT_BREAKS = np.array([0.9, 1.0, 1.05])
+_PUT_DELTAS = np.array([-0.75, -0.50, -0.30, -0.15])
+
+
+def _approx_delta(moneyness, is_call: bool):
+    """Table lookup of the rough delta estimate for scalar or array input."""
+    if is_call:
+        idx = np.searchsorted(_CALL_BREAKS, moneyness, side='left')
+        return _CALL_DELTAS[idx]
+    idx = np.searchsorted(_PUT_BREAKS, moneyness, side='right')
+    return _PUT_DELTAS[idx]
+
+
+def _narrow_chain(df: pd.DataFrame) -> pd.DataFrame:
+    """Project an option-chain frame down to the columns we use."""
+    keep = [c for c in _CHAIN_COLUMNS if c in df.columns]
+    narrowed = df[keep]
+    dtypes = {c: np.float32 for c in _CHAIN_FLOAT32 if c in narrowed.columns}
+    dtypes.update({c: 'Int32' for c in _CHAIN_INT32 if c in narrowed.columns})
+    return narrowed.astype(dtypes, copy=False)
 
 
 class OptionsChain:
@@ -14,22 +53,42 @@ class OptionsChain:
     Fetch and process options chain data for stocks.
     """
 
-    def __init__(self, ticker: str):
+    def __init__(
+        self,
+        ticker: str,
+        timeout: float = 10.0,
+        ticker_obj=None,
+        price: Optional[float] = None
+    ):
         """
         Initialize options chain fetcher.
 
         Args:
             ticker: Stock ticker symbol
+            timeout: Per-request timeout in seconds for upstream data fetches
+            ticker_obj: Shared yfinance Ticker handle (reuses its caches)
+            price: Known current price (e.g. from a bulk quote download);
+                seeds the price memo so get_current_price skips its fetch
         """
         self.ticker = ticker.upper()
-        self.stock = None
+        self.timeout = timeout
         self.logger = logging.getLogger(__name__)
-        self._fetch_stock_data()
+        # Per-instance memoization: the same expirations/price/chains are
+        # read repeatedly within one screening or analysis pass
+        self._chain_cache: Dict[str, Tuple[pd.DataFrame, pd.DataFrame]] = {}
+        self._expirations: Optional[List[str]] = None
+        self._expirations_np: Optional[np.ndarray] = None
+        self._price: Optional[float] = price
+        if ticker_obj is not None:
+            self.stock = ticker_obj
+        else:
+            self.stock = None
+            self._fetch_stock_data()
 
     def _fetch_stock_data(self) -> None:
-        """Fetch stock data from yfinance."""
+        """Fetch stock data from yfinance over the shared pooled session."""
         try:
-            self.stock = yf.Ticker(self.ticker)
+            self.stock = yf.Ticker(self.ticker, session=SESSION)
         except Exception as e:
             self.logger.error(f"Error fetching stock data for {self.ticker}: {e}")
             raise
@@ -41,14 +100,50 @@ class OptionsChain:
         Returns:
             Current stock price or None if unavailable
         """
+        if self._price is not None:
+            return self._price
         try:
-            info = self.stock.info
-            price = info.get('currentPrice') or info.get('regularMarketPrice')
-            return float(price) if price else None
+            # fast_info hits the light quote endpoint; the heavy
+            # quoteSummary .info call is only a fallback
+            fast = self.stock.fast_info
+            price = getattr(fast, 'last_price', None)
+            if not price:
+                info = self.stock.info
+                price = info.get('currentPrice') or info.get('regularMarketPrice')
+            self._price = float(price) if price else None
+            return self._price
         except Exception as e:
             self.logger.error(f"Error fetching price for {self.ticker}: {e}")
             return None
 
+    async def async_get_current_price(self, client) -> Optional[float]:
+        """
+        Get current stock price over a shared async HTTP client.
+
+        Hits Yahoo's chart endpoint directly so the request rides the
+        caller's httpx.AsyncClient connection pool instead of blocking a
+        worker thread on yfinance.
+
+        Args:
+            client: httpx.AsyncClient to issue the request on
+
+        Returns:
+            Current stock price or None if unavailable
+        """
+        try:
+            response = await client.get(
+                f"https://query1.finance.yahoo.com/v8/finance/chart/{self.ticker}",
+                params={"interval": "1d", "range": "1d"},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            meta = response.json()['chart']['result'][0]['meta']
+            price = meta.get('regularMarketPrice')
+            return float(price) if price else None
+        except Exception as e:
+            self.logger.error(f"Error fetching async price for {self.ticker}: {e}")
+            return None
+
     def get_expiration_dates(self) -> List[str]:
         """
         Get all available options expiration dates.
@@ -56,8 +151,11 @@ class OptionsChain:
         Returns:
             List of expiration dates as strings
         """
+        if self._expirations is not None:
+            return self._expirations
         try:
-            return list(self.stock.options)
+            self._expirations = list(self.stock.options)
+            return self._expirations
         except Exception as e:
             self.logger.error(f"Error fetching expiration dates for {self.ticker}: {e}")
             return []
@@ -72,9 +170,16 @@ class OptionsChain:
         Returns:
             Tuple of (calls_df, puts_df)
         """
+        cached = self._chain_cache.get(expiration_date)
+        if cached is not None:
+            return cached
         try:
             opt_chain = self.stock.option_chain(expiration_date)
-            return opt_chain.calls, opt_chain.puts
+            self._chain_cache[expiration_date] = (
+                _narrow_chain(opt_chain.calls),
+                _narrow_chain(opt_chain.puts),
+            )
+            return self._chain_cache[expiration_date]
         except Exception as e:
             self.logger.error(f"Error fetching options chain for {self.ticker} on {expiration_date}: {e}")
             return pd.DataFrame(), pd.DataFrame()
@@ -112,8 +217,10 @@ class OptionsChain:
         # Note: yfinance doesn't always provide Greeks, so we'll approximate
         # or users should integrate with a service that provides Greeks
         if 'delta' in options_df.columns:
-            mask = (abs(options_df['delta']) >= delta_min) & (abs(options_df['delta']) <= delta_max)
-            return options_df[mask]
+            # Mask on the raw ndarray: one fused pass, no intermediate Series
+            deltas = np.abs(options_df['delta'].to_numpy(dtype=np.float32, copy=False))
+            mask = (deltas >= delta_min) & (deltas <= delta_max)
+            return options_df.iloc[mask]
         else:
             self.logger.warning(f"Delta not available for {self.ticker}, returning all options")
             return options_df
@@ -149,11 +256,11 @@ class OptionsChain:
 
         # Use bid price for premium (conservative estimate)
         if 'bid' in options_df.columns:
-            mask = options_df['bid'] >= min_premium
-            return options_df[mask]
+            mask = options_df['bid'].to_numpy(dtype=np.float32, copy=False) >= min_premium
+            return options_df.iloc[mask]
         elif 'lastPrice' in options_df.columns:
-            mask = options_df['lastPrice'] >= min_premium
-            return options_df[mask]
+            mask = options_df['lastPrice'].to_numpy(dtype=np.float32, copy=False) >= min_premium
+            return options_df.iloc[mask]
         else:
             return options_df
 
@@ -175,10 +282,9 @@ class OptionsChain:
         if calls.empty:
             return None
 
-        # Find strike closest to current price
-        strikes = calls['strike'].values
-        atm_strike = min(strikes, key=lambda x: abs(x - stock_price))
-        return float(atm_strike)
+        # Find strike closest to current price in one vectorized reduction
+        strikes = calls['strike'].to_numpy()
+        return float(strikes[np.abs(strikes - stock_price).argmin()])
 
     def get_options_volume_stats(self) -> Dict[str, float]:
         """
@@ -192,23 +298,22 @@ class OptionsChain:
             if not expirations:
                 return {'total_volume': 0, 'avg_volume': 0, 'total_open_interest': 0}
 
-            total_volume = 0
-            total_open_interest = 0
-            count = 0
-
-            # Check first few expirations
-            for exp in expirations[:3]:
-                calls, puts = self.get_options_chain(exp)
+            # The first few expirations are independent HTTP fetches, so
+            # overlap them; cached chains return immediately
+            targets = expirations[:3]
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                chains = list(pool.map(self.get_options_chain, targets))
 
-                for df in [calls, puts]:
-                    if not df.empty:
-                        if 'volume' in df.columns:
-                            total_volume += df['volume'].sum()
-                        if 'openInterest' in df.columns:
-                            total_open_interest += df['openInterest'].sum()
-                        count += 1
+            frames = [df for calls, puts in chains for df in (calls, puts) if not df.empty]
+            if not frames:
+                return {'total_volume': 0, 'avg_volume': 0, 'total_open_interest': 0}
 
-            avg_volume = total_volume / count if count > 0 else 0
+            # Concatenate once and reduce both columns in a single pass
+            merged = pd.concat(frames, ignore_index=True, copy=False)
+            sums = merged.reindex(columns=['volume', 'openInterest']).sum()
+            total_volume = sums['volume']
+            total_open_interest = sums['openInterest']
+            avg_volume = total_volume / len(frames)
 
             return {
                 'total_volume': total_volume,
@@ -232,14 +337,18 @@ class OptionsChain:
         try:
             calls, puts = self.get_options_chain(expiration_date)
 
-            ivs = []
-            for df in [calls, puts]:
-                if not df.empty and 'impliedVolatility' in df.columns:
-                    ivs.extend(df['impliedVolatility'].dropna().tolist())
-
-            if ivs:
-                return sum(ivs) / len(ivs)
-            return None
+            # Average in pandas directly instead of round-tripping every
+            # value through a Python list
+            parts = [
+                df['impliedVolatility']
+                for df in (calls, puts)
+                if not df.empty and 'impliedVolatility' in df.columns
+            ]
+            if not parts:
+                return None
+
+            mean_iv = pd.concat(parts, copy=False).mean(skipna=True)
+            return float(mean_iv) if pd.notna(mean_iv) else None
         except Exception as e:
             self.logger.error(f"Error calculating IV for {self.ticker}: {e}")
             return None
@@ -258,15 +367,14 @@ class OptionsChain:
         if not expirations:
             return None
 
-        target_date = datetime.now() + timedelta(days=target_dte)
-
-        # Find closest expiration
-        closest_exp = min(
-            expirations,
-            key=lambda x: abs((datetime.strptime(x, '%Y-%m-%d') - target_date).days)
-        )
+        # Parse the whole list once as datetime64 days and keep it; the
+        # nearest date is then a single vectorized argmin
+        if self._expirations_np is None or len(self._expirations_np) != len(expirations):
+            self._expirations_np = np.array(expirations, dtype='datetime64[D]')
 
-        return closest_exp
+        target = np.datetime64((datetime.now() + timedelta(days=target_dte)).date(), 'D')
+        idx = np.abs((self._expirations_np - target).astype('int64')).argmin()
+        return expirations[int(idx)]
 
     def get_option_greeks_approximation(
         self,
@@ -295,29 +403,8 @@ class OptionsChain:
         if not stock_price:
             return {}
 
-        # Simple delta approximation
-        moneyness = stock_price / strike
-
-        if option_type.lower() == 'call':
-            # Rough delta estimate for calls
-            if moneyness > 1.1:
-                delta = 0.75
-            elif moneyness > 1.0:
-                delta = 0.50
-            elif moneyness > 0.95:
-                delta = 0.30
-            else:
-                delta = 0.15
-        else:
-            # Rough delta estimate for puts
-            if moneyness < 0.9:
-                delta = -0.75
-            elif moneyness < 1.0:
-                delta = -0.50
-            elif moneyness < 1.05:
-                delta = -0.30
-            else:
-                delta = -0.15
+        # Simple delta approximation via the moneyness lookup table
+        delta = float(_approx_delta(stock_price / strike, option_type.lower() == 'call'))
 
         return {
             'delta': delta,
@@ -325,3 +412,40 @@ class OptionsChain:
             'theta': -0.02,  # Placeholder
             'vega': 0.10     # Placeholder
         }
+
+    def get_option_greeks_batch(
+        self,
+        option_type: str,
+        strikes: np.ndarray,
+        stock_price: Optional[float] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Get approximate Greeks for a whole strike array in one call.
+
+        Same rough estimates as get_option_greeks_approximation, but the
+        delta lookup runs as a single searchsorted over the strike array
+        instead of a Python loop per strike.
+
+        Args:
+            option_type: 'call' or 'put'
+            strikes: Array of strike prices
+            stock_price: Current stock price
+
+        Returns:
+            Dictionary with per-strike Greek arrays
+        """
+        if stock_price is None:
+            stock_price = self.get_current_price()
+
+        if not stock_price:
+            return {}
+
+        strikes = np.asarray(strikes, dtype=np.float64)
+        deltas = _approx_delta(stock_price / strikes, option_type.lower() == 'call')
+
+        return {
+            'delta': deltas,
+            'gamma': np.full_like(deltas, 0.05),   # Placeholder
+            'theta': np.full_like(deltas, -0.02),  # Placeholder
+            'vega': np.full_like(deltas, 0.10)     # Placeholder
+        }
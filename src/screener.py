@@ -3,13 +3,30 @@ Stock screening for wheel strategy candidates
 """
 
 from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import functools
 import logging
+import os
+import time
 import yfinance as yf
+import numpy as np
 import pandas as pd
+from src.http import SESSION
 from src.options_chain import OptionsChain
 from src.utils import load_config
 
 
+def _screen_one(config: Dict, ticker: str) -> Optional[Dict]:
+    """
+    Screen a single ticker in a worker process.
+
+    Module-level (not a bound method) so ProcessPoolExecutor can pickle
+    the call; each worker builds its screener from the passed config.
+    """
+    return StockScreener(config).screen_ticker(ticker)
+
+
 class StockScreener:
     """
     Screen stocks for wheel strategy suitability.
@@ -37,20 +54,36 @@ class StockScreener:
             Dictionary with screening results or None if doesn't meet criteria
         """
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
-
-            # Basic validation
-            if not info:
-                self.logger.warning(f"No data available for {ticker}")
-                return None
-
-            # Extract key metrics
-            market_cap = info.get('marketCap', 0)
-            price = info.get('currentPrice') or info.get('regularMarketPrice', 0)
-            avg_volume = info.get('averageVolume', 0)
-            sector = info.get('sector', 'Unknown')
-            industry = info.get('industry', 'Unknown')
+            stock = yf.Ticker(ticker, session=SESSION)
+
+            # Light quote endpoint first: when it covers every gate input,
+            # the heavy quoteSummary .info call is deferred past the gates
+            try:
+                fast = stock.fast_info
+                price = getattr(fast, 'last_price', None)
+                market_cap = getattr(fast, 'market_cap', None)
+                avg_volume = getattr(fast, 'three_month_average_volume', None)
+            except Exception:
+                price = market_cap = avg_volume = None
+
+            # Fall back to .info per missing field — fast_info lacks e.g.
+            # market cap for ETFs, and coercing that to 0 would wrongly
+            # reject them at the market-cap gate
+            if price is None or market_cap is None or avg_volume is None:
+                info = stock.info
+                if not info and price is None:
+                    self.logger.warning(f"No data available for {ticker}")
+                    return None
+                info = info or {}
+                if price is None:
+                    price = info.get('currentPrice') or info.get('regularMarketPrice', 0)
+                if market_cap is None:
+                    market_cap = info.get('marketCap', 0)
+                if avg_volume is None:
+                    avg_volume = info.get('averageVolume', 0)
+            price = price or 0
+            market_cap = market_cap or 0
+            avg_volume = avg_volume or 0
 
             # Check basic criteria
             min_market_cap = self.screening_criteria.get('min_market_cap', 10_000_000_000)
@@ -70,6 +103,12 @@ class StockScreener:
                 self.logger.debug(f"{ticker}: Volume too low ({avg_volume})")
                 return None
 
+            # Sector/industry only exist in the full .info payload; fetch it
+            # now that the cheap gates have passed
+            info = stock.info
+            sector = info.get('sector', 'Unknown') if info else 'Unknown'
+            industry = info.get('industry', 'Unknown') if info else 'Unknown'
+
             # Check sector/industry exclusions
             excluded_sectors = self.screening_criteria.get('excluded_sectors', [])
             excluded_industries = self.screening_criteria.get('excluded_industries', [])
@@ -78,8 +117,8 @@ class StockScreener:
                 self.logger.debug(f"{ticker}: Excluded sector/industry ({sector}/{industry})")
                 return None
 
-            # Check options availability and volume
-            options_chain = OptionsChain(ticker)
+            # Check options availability and volume (reusing the same handle)
+            options_chain = OptionsChain(ticker, ticker_obj=stock)
             volume_stats = options_chain.get_options_volume_stats()
 
             min_options_volume = self.screening_criteria.get('min_options_volume', 500)
@@ -120,30 +159,88 @@ class StockScreener:
             self.logger.error(f"Error screening {ticker}: {e}")
             return None
 
-    def screen_multiple_tickers(self, tickers: List[str]) -> pd.DataFrame:
+    def screen_multiple_tickers(self, tickers: List[str], top_k: Optional[int] = None) -> pd.DataFrame:
         """
         Screen multiple tickers.
 
         Args:
             tickers: List of ticker symbols
+            top_k: Keep only the top K results by market cap (partial
+                selection instead of a full sort)
 
         Returns:
             DataFrame with screening results
         """
-        results = []
-
-        for ticker in tickers:
-            self.logger.info(f"Screening {ticker}...")
-            result = self.screen_ticker(ticker)
-            if result:
-                results.append(result)
+        # Screening is network-bound, so the default path stays in-process;
+        # the process pool is an opt-in for CPU-heavy custom criteria.
+        if self.config.get('io', {}).get('use_process_pool', False):
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                worker = functools.partial(_screen_one, self.config)
+                results = [r for r in pool.map(worker, tickers) if r]
+        else:
+            results = []
+            for ticker in tickers:
+                self.logger.info(f"Screening {ticker}...")
+                result = self.screen_ticker(ticker)
+                if result:
+                    results.append(result)
 
         if not results:
             return pd.DataFrame()
 
         df = pd.DataFrame(results)
+        if top_k is not None:
+            return df.nlargest(top_k, 'market_cap')
         return df.sort_values('market_cap', ascending=False)
 
+    async def screen_multiple_tickers_async(self, tickers: List[str]) -> pd.DataFrame:
+        """
+        Screen multiple tickers concurrently on the running event loop.
+
+        Each ticker's blocking screen runs in a worker thread, with a
+        semaphore capping in-flight upstream requests at 8, so wall time
+        scales with the concurrency limit rather than the ticker count.
+
+        Args:
+            tickers: List of ticker symbols
+
+        Returns:
+            DataFrame with screening results
+        """
+        semaphore = asyncio.Semaphore(8)
+
+        async def _one(ticker: str) -> Optional[Dict]:
+            async with semaphore:
+                return await asyncio.to_thread(self.screen_ticker, ticker)
+
+        outcomes = await asyncio.gather(
+            *(_one(ticker) for ticker in tickers), return_exceptions=True
+        )
+
+        results = []
+        for ticker, outcome in zip(tickers, outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Error screening {ticker}: {outcome}")
+            elif outcome:
+                results.append(outcome)
+
+        if not results:
+            return pd.DataFrame()
+
+        return pd.DataFrame(results).sort_values('market_cap', ascending=False)
+
+    def screen_multiple_tickers_concurrent(self, tickers: List[str]) -> pd.DataFrame:
+        """
+        Synchronous wrapper around screen_multiple_tickers_async.
+
+        Args:
+            tickers: List of ticker symbols
+
+        Returns:
+            DataFrame with screening results
+        """
+        return asyncio.run(self.screen_multiple_tickers_async(tickers))
+
     def get_popular_wheel_tickers(self) -> List[str]:
         """
         Get a list of popular tickers commonly used for wheel strategy.
@@ -170,24 +267,166 @@ class StockScreener:
         ]
         return popular_tickers
 
+    def _load_universe(self, day_bucket: int) -> pd.DataFrame:
+        """
+        Load static metadata for the popular-ticker universe (cached daily).
+
+        An empty frame means the upstream fetch failed outright; caching it
+        would serve empty screens until midnight rollover, so the entry is
+        evicted and the next request refetches.
+
+        Args:
+            day_bucket: Current day number (time // 86400), used as cache key
+
+        Returns:
+            DataFrame with one row per ticker and its static metadata
+        """
+        universe = self._load_universe_cached(day_bucket)
+        if universe.empty:
+            self._load_universe_cached.cache_clear()
+        return universe
+
+    @functools.lru_cache(maxsize=4)
+    def _load_universe_cached(self, day_bucket: int) -> pd.DataFrame:
+        """
+        Fetch static metadata for the popular-ticker universe.
+
+        Sector, industry, market cap and average volume change slowly, so the
+        result is cached per day bucket and reused across screen requests.
+
+        Args:
+            day_bucket: Current day number (time // 86400), used as cache key
+
+        Returns:
+            DataFrame with one row per ticker and its static metadata
+        """
+        rows = []
+        for ticker in self.get_popular_wheel_tickers():
+            try:
+                info = yf.Ticker(ticker, session=SESSION).info
+                if not info:
+                    self.logger.warning(f"No data available for {ticker}")
+                    continue
+                rows.append({
+                    'ticker': ticker,
+                    'market_cap': info.get('marketCap', 0),
+                    'avg_volume': info.get('averageVolume', 0),
+                    'sector': info.get('sector', 'Unknown'),
+                    'industry': info.get('industry', 'Unknown')
+                })
+            except Exception as e:
+                self.logger.error(f"Error loading universe entry {ticker}: {e}")
+
+        return pd.DataFrame(rows)
+
+    def _enrich_dynamic(self, universe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fetch the mutable per-ticker fields for a statically filtered universe.
+
+        Only price, options volume, open interest and implied volatility are
+        refetched here; the static metadata comes from the cached universe.
+
+        Args:
+            universe: DataFrame from _load_universe, already filtered on
+                market cap, volume and sector/industry exclusions
+
+        Returns:
+            DataFrame of tickers passing the dynamic criteria
+        """
+        min_price = self.screening_criteria.get('min_price', 10.0)
+        max_price = self.screening_criteria.get('max_price', 500.0)
+        min_options_volume = self.screening_criteria.get('min_options_volume', 500)
+        min_open_interest = self.screening_criteria.get('min_open_interest', 1000)
+
+        results = []
+        for row in universe.itertuples(index=False):
+            try:
+                options_chain = OptionsChain(row.ticker)
+                price = options_chain.get_current_price()
+
+                if price is None or price < min_price or price > max_price:
+                    self.logger.debug(f"{row.ticker}: Price out of range ({price})")
+                    continue
+
+                volume_stats = options_chain.get_options_volume_stats()
+
+                if volume_stats['avg_volume'] < min_options_volume:
+                    self.logger.debug(f"{row.ticker}: Options volume too low ({volume_stats['avg_volume']})")
+                    continue
+
+                if volume_stats['total_open_interest'] < min_open_interest:
+                    self.logger.debug(f"{row.ticker}: Open interest too low ({volume_stats['total_open_interest']})")
+                    continue
+
+                expirations = options_chain.get_expiration_dates()
+                iv = None
+                if expirations:
+                    iv = options_chain.get_implied_volatility(expirations[0])
+
+                results.append({
+                    'ticker': row.ticker,
+                    'price': price,
+                    'market_cap': row.market_cap,
+                    'avg_volume': row.avg_volume,
+                    'sector': row.sector,
+                    'industry': row.industry,
+                    'options_volume': volume_stats['avg_volume'],
+                    'open_interest': volume_stats['total_open_interest'],
+                    'implied_volatility': iv,
+                    'passes_screen': True
+                })
+                self.logger.info(f"{row.ticker}: Passed screening")
+
+            except Exception as e:
+                self.logger.error(f"Error screening {row.ticker}: {e}")
+
+        if not results:
+            return pd.DataFrame()
+
+        return pd.DataFrame(results).sort_values('market_cap', ascending=False)
+
     def run_default_screen(self) -> pd.DataFrame:
         """
         Run screening on popular wheel strategy candidates.
 
+        Static universe metadata is cached for a day; only the mutable
+        fields (price, options volume, IV) are fetched per request.
+
         Returns:
             DataFrame with screening results
         """
-        tickers = self.get_popular_wheel_tickers()
-        self.logger.info(f"Screening {len(tickers)} popular tickers...")
-        return self.screen_multiple_tickers(tickers)
-
-    def screen_by_sector(self, sector: str, universe: Optional[List[str]] = None) -> pd.DataFrame:
+        universe = self._load_universe(int(time.time() // 86400))
+        if universe.empty:
+            return universe
+
+        min_market_cap = self.screening_criteria.get('min_market_cap', 10_000_000_000)
+        min_avg_volume = self.screening_criteria.get('min_avg_volume', 1_000_000)
+        excluded_sectors = self.screening_criteria.get('excluded_sectors', [])
+        excluded_industries = self.screening_criteria.get('excluded_industries', [])
+
+        mask = (
+            (universe['market_cap'] >= min_market_cap)
+            & (universe['avg_volume'] >= min_avg_volume)
+            & ~universe['sector'].isin(excluded_sectors)
+            & ~universe['industry'].isin(excluded_industries)
+        )
+        candidates = universe[mask]
+        self.logger.info(f"Screening {len(candidates)} of {len(universe)} universe tickers...")
+        return self._enrich_dynamic(candidates)
+
+    def screen_by_sector(
+        self,
+        sector: str,
+        universe: Optional[List[str]] = None,
+        top_k: Optional[int] = None
+    ) -> pd.DataFrame:
         """
         Screen stocks within a specific sector.
 
         Args:
             sector: Sector name
             universe: List of tickers to check (defaults to popular tickers)
+            top_k: Keep only the top K results by market cap
 
         Returns:
             DataFrame with screening results for the sector
@@ -204,14 +443,19 @@ class StockScreener:
         if not results:
             return pd.DataFrame()
 
-        return pd.DataFrame(results).sort_values('market_cap', ascending=False)
+        df = pd.DataFrame(results)
+        if top_k is not None:
+            return df.nlargest(top_k, 'market_cap')
+        return df.sort_values('market_cap', ascending=False)
 
-    def rank_candidates(self, screened_df: pd.DataFrame) -> pd.DataFrame:
+    def rank_candidates(self, screened_df: pd.DataFrame, top_k: Optional[int] = None) -> pd.DataFrame:
         """
         Rank screened candidates by attractiveness for wheel strategy.
 
         Args:
-            screened_df: DataFrame from screening results
+            screened_df: DataFrame from screening results; score columns are
+                added to it in place (no defensive copy)
+            top_k: Keep only the top K candidates by wheel score
 
         Returns:
             DataFrame with ranking scores
@@ -219,37 +463,44 @@ class StockScreener:
         if screened_df.empty:
             return screened_df
 
-        df = screened_df.copy()
-
-        # Initialize score
-        df['wheel_score'] = 0
+        df = screened_df
 
-        # Score based on options liquidity (higher is better)
+        # Read each input column once, then combine every contribution in
+        # a single fused expression and one wheel_score assignment
+        vol_score = 0.0
         if 'options_volume' in df.columns:
-            max_vol = df['options_volume'].max()
+            volume = df['options_volume'].to_numpy(dtype=np.float64, copy=False)
+            max_vol = volume.max()
             if max_vol > 0:
-                df['wheel_score'] += (df['options_volume'] / max_vol) * 30
+                vol_score = (volume / max_vol) * 30.0
 
-        # Score based on open interest (higher is better)
+        oi_score = 0.0
         if 'open_interest' in df.columns:
-            max_oi = df['open_interest'].max()
+            open_interest = df['open_interest'].to_numpy(dtype=np.float64, copy=False)
+            max_oi = open_interest.max()
             if max_oi > 0:
-                df['wheel_score'] += (df['open_interest'] / max_oi) * 30
+                oi_score = (open_interest / max_oi) * 30.0
 
-        # Score based on implied volatility (moderate is better)
+        # Implied volatility scoring (moderate is better); np.select picks
+        # the band per row without an apply(lambda) loop
+        iv_score = 0.0
         if 'implied_volatility' in df.columns:
-            # Prefer IV between 0.25 and 0.50
-            df['iv_score'] = df['implied_volatility'].apply(
-                lambda x: 40 if pd.notna(x) and 0.25 <= x <= 0.50 else
-                         30 if pd.notna(x) and 0.20 <= x <= 0.60 else
-                         20 if pd.notna(x) else 0
-            )
-            df['wheel_score'] += df['iv_score']
-
-        # Sort by score
-        df = df.sort_values('wheel_score', ascending=False)
-
-        return df
+            iv = df['implied_volatility'].to_numpy(dtype=np.float64, copy=False)
+            notna = ~np.isnan(iv)
+            conditions = [
+                notna & (iv >= 0.25) & (iv <= 0.50),  # Prefer IV between 0.25 and 0.50
+                notna & (iv >= 0.20) & (iv <= 0.60),
+                notna
+            ]
+            iv_score = np.select(conditions, [40, 30, 20], default=0)
+            df['iv_score'] = iv_score
+
+        df['wheel_score'] = vol_score + oi_score + iv_score
+
+        # Heap-select when the caller only wants the top K, else full sort
+        if top_k is not None:
+            return df.nlargest(top_k, 'wheel_score')
+        return df.sort_values('wheel_score', ascending=False)
 
     def export_results(self, df: pd.DataFrame, filename: str = "wheel_candidates.csv") -> None:
         """
@@ -260,7 +511,9 @@ class StockScreener:
             filename: Output filename
         """
         try:
-            df.to_csv(filename, index=False)
+            # float_format keeps float rendering inside the C writer instead
+            # of a Python repr per cell
+            df.to_csv(filename, index=False, float_format='%.4f')
             self.logger.info(f"Results exported to {filename}")
         except Exception as e:
             self.logger.error(f"Error exporting results: {e}")
@@ -2,12 +2,36 @@
 Utility functions for the Wheel Strategy Analyzer
 """
 
+import copy
+import functools
 import os
+import re
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
+import numpy as np
 import yaml
 import logging
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+# libyaml's C loader parses ~10x faster than the pure-Python SafeLoader;
+# fall back when PyYAML was built without it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a config file once per (path, mtime); edits invalidate the key."""
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
 
 def load_config(config_path: str = "config/settings.yaml") -> Dict[str, Any]:
     """
@@ -20,9 +44,9 @@ def load_config(config_path: str = "config/settings.yaml") -> Dict[str, Any]:
         Dictionary containing configuration settings
     """
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        return config
+        # Deep-copy so callers can mutate their config (e.g. per-request
+        # screening overrides) without poisoning the cached parse
+        return copy.deepcopy(_load_config_cached(config_path, os.path.getmtime(config_path)))
     except FileNotFoundError:
         logging.warning(f"Config file not found at {config_path}, using defaults")
         return get_default_config()
@@ -87,6 +111,14 @@ def setup_logging(log_level: str = "INFO", log_dir: str = "logs") -> None:
     )
 
 
+@functools.lru_cache(maxsize=1024)
+def _days_to_expiration_cached(expiration_date: str, today_ordinal: int) -> int:
+    """Parse an expiration string once per (date, day); keyed on today's
+    ordinal so cached answers roll over at midnight."""
+    parsed = datetime.strptime(expiration_date, '%Y-%m-%d')
+    return max(0, parsed.toordinal() - today_ordinal)
+
+
 def calculate_days_to_expiration(expiration_date: datetime) -> int:
     """
     Calculate days to expiration from today.
@@ -97,14 +129,29 @@ def calculate_days_to_expiration(expiration_date: datetime) -> int:
     Returns:
         Number of days until expiration
     """
+    # The same expiration strings recur across every chain in a screening
+    # run; skip the repeated strptime for them
     if isinstance(expiration_date, str):
-        expiration_date = datetime.strptime(expiration_date, '%Y-%m-%d')
+        return _days_to_expiration_cached(expiration_date, datetime.now().toordinal())
 
     today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
     delta = expiration_date - today
     return max(0, delta.days)
 
 
+# Memoized 365/days factors; callers sweep a small fixed DTE ladder
+# (7, 14, 30, 45...), so this saves a division per option row
+_PERIODS_CACHE: Dict[int, float] = {}
+
+
+def _periods_per_year(days: int) -> float:
+    """Return the (cached) number of compounding periods per year."""
+    periods = _PERIODS_CACHE.get(days)
+    if periods is None:
+        periods = _PERIODS_CACHE[days] = 365.0 / days
+    return periods
+
+
 def annualize_return(return_pct: float, days: int) -> float:
     """
     Annualize a return based on holding period.
@@ -120,7 +167,7 @@ def annualize_return(return_pct: float, days: int) -> float:
         return 0.0
 
     # Use compound interest formula
-    periods_per_year = 365.0 / days
+    periods_per_year = _periods_per_year(days)
     annualized = ((1 + return_pct / 100) ** periods_per_year - 1) * 100
     return annualized
 
@@ -158,6 +205,50 @@ def format_percentage(value: float, decimal_places: int = 2) -> str:
     return f"{value * 100:.{decimal_places}f}%"
 
 
+# Single-pass validation: symbols are 1-10 uppercase alphanumerics with
+# optional dots (class shares like BRK.B)
+_TICKER_RE = re.compile(r'^[A-Z0-9.]{1,10}$')
+
+
+def format_currency_series(amounts, currency: str = "USD"):
+    """
+    Format a whole Series of amounts as currency strings.
+
+    One precompiled format spec applied via Series.map, instead of a
+    Python format_currency call per cell.
+
+    Args:
+        amounts: Series of amounts to format
+        currency: Currency symbol/code
+
+    Returns:
+        Series of formatted currency strings
+    """
+    if currency == "USD":
+        return amounts.map('${:,.2f}'.format)
+    return amounts.map(f'{{:,.2f}} {currency}'.format)
+
+
+def format_percentage_series(values, decimal_places: int = 2):
+    """
+    Format a whole Series of values as percentage strings.
+
+    Decides fraction-vs-percent form per element with one vectorized
+    where, matching the scalar format_percentage on mixed-magnitude
+    series, then applies one format spec via map.
+
+    Args:
+        values: Series of values to format
+        decimal_places: Number of decimal places
+
+    Returns:
+        Series of formatted percentage strings
+    """
+    spec = f'{{:.{decimal_places}f}}%'.format
+    scaled = values.where(values.abs() > 1, values * 100)
+    return scaled.map(spec)
+
+
 def validate_ticker(ticker: str) -> str:
     """
     Validate and normalize ticker symbol.
@@ -177,13 +268,28 @@ def validate_ticker(ticker: str) -> str:
     # Remove whitespace and convert to uppercase
     ticker = ticker.strip().upper()
 
-    # Basic validation
-    if not ticker.isalnum() and '.' not in ticker:
+    if not _TICKER_RE.match(ticker):
         raise ValueError(f"Invalid ticker format: {ticker}")
 
     return ticker
 
 
+def validate_tickers(tickers) -> list:
+    """
+    Validate and normalize a batch of ticker symbols.
+
+    Args:
+        tickers: Iterable of ticker symbols
+
+    Returns:
+        List of normalized ticker symbols
+
+    Raises:
+        ValueError: If any ticker is invalid
+    """
+    return [validate_ticker(ticker) for ticker in tickers]
+
+
 def get_next_monthly_expiration(base_date: Optional[datetime] = None) -> datetime:
     """
     Get the next monthly options expiration (3rd Friday of the month).
@@ -211,6 +317,49 @@ def get_next_monthly_expiration(base_date: Optional[datetime] = None) -> datetim
     return third_friday
 
 
+def fast_records(df) -> list:
+    """
+    Convert a DataFrame to a list of per-row dicts.
+
+    Converts one column at a time with .tolist() — keeping each column's
+    dtype, where a whole-frame to_numpy() would upcast ints to float —
+    then zips rows together, instead of pandas' to_dict('records') which
+    boxes each value individually and is several times slower on wide
+    result frames.
+
+    Args:
+        df: DataFrame to convert
+
+    Returns:
+        List of dictionaries, one per row
+    """
+    columns = df.columns.tolist()
+    column_values = [df[column].tolist() for column in columns]
+    return [dict(zip(columns, row)) for row in zip(*column_values)]
+
+
+@njit(cache=True)
+def _iv_rank_nb(current_iv, iv_history):
+    """Compiled min/max scan and rank over a float64 history array."""
+    min_iv = iv_history[0]
+    max_iv = iv_history[0]
+    for iv in iv_history:
+        if iv < min_iv:
+            min_iv = iv
+        if iv > max_iv:
+            max_iv = iv
+
+    if max_iv == min_iv:
+        return 50.0
+
+    iv_rank = ((current_iv - min_iv) / (max_iv - min_iv)) * 100.0
+    if iv_rank < 0.0:
+        return 0.0
+    if iv_rank > 100.0:
+        return 100.0
+    return iv_rank
+
+
 def calculate_iv_rank(current_iv: float, iv_history: list) -> float:
     """
     Calculate IV rank (where current IV stands in 52-week range).
@@ -222,14 +371,34 @@ def calculate_iv_rank(current_iv: float, iv_history: list) -> float:
     Returns:
         IV rank as percentage (0-100)
     """
-    if not iv_history or len(iv_history) < 2:
+    if iv_history is None or len(iv_history) < 2:
         return 50.0  # Default to middle if no history
 
-    min_iv = min(iv_history)
-    max_iv = max(iv_history)
+    history = np.asarray(iv_history, dtype=np.float64)
+    # Round away float noise so clean midpoints rank as exact values
+    return round(float(_iv_rank_nb(float(current_iv), history)), 9)
 
-    if max_iv == min_iv:
-        return 50.0
 
-    iv_rank = ((current_iv - min_iv) / (max_iv - min_iv)) * 100
-    return max(0, min(100, iv_rank))
+def calculate_iv_rank_batch(current_ivs, iv_history_matrix) -> np.ndarray:
+    """
+    Calculate IV rank for many tickers in one vectorized pass.
+
+    Args:
+        current_ivs: Array of current implied volatilities, one per row
+        iv_history_matrix: 2D array of historical IV values (rows match
+            current_ivs)
+
+    Returns:
+        Array of IV ranks as percentages (0-100)
+    """
+    current = np.asarray(current_ivs, dtype=np.float64)
+    history = np.asarray(iv_history_matrix, dtype=np.float64)
+
+    min_iv = history.min(axis=1)
+    max_iv = history.max(axis=1)
+    spread = max_iv - min_iv
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ranks = (current - min_iv) / spread * 100.0
+    ranks = np.where(spread == 0.0, 50.0, ranks)
+    return np.clip(np.round(ranks, 9), 0.0, 100.0)
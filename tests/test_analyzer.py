@@ -5,6 +5,7 @@ Unit tests for wheel strategy analyzer
 import pytest
 import sys
 import os
+import numpy as np
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -14,6 +15,7 @@ from src.utils import (
     annualize_return,
     calculate_days_to_expiration,
     calculate_iv_rank,
+    calculate_iv_rank_batch,
     validate_ticker,
     format_percentage
 )
@@ -75,6 +77,66 @@ class TestReturnCalculator:
         assert 'total_premium' in result
         assert result['total_premium'] == 350.0  # (2.0 + 1.5) * 100
 
+    def test_put_return_vectorized_matches_scalar(self):
+        """Test vectorized put returns agree with the scalar calculation."""
+        calculator = ReturnCalculator()
+
+        strikes = np.array([90.0, 95.0])
+        premiums = np.array([1.0, 2.0])
+
+        vec = calculator.calculate_put_return_vec(
+            stock_price=100.0,
+            strikes=strikes,
+            premiums=premiums,
+            days_to_expiration=30
+        )
+
+        for i, (strike, premium) in enumerate(zip(strikes, premiums)):
+            scalar = calculator.calculate_put_return(100.0, strike, premium, 30)
+            # Vectorized kernels compute in float32, so compare loosely
+            assert vec['return_pct'][i] == pytest.approx(scalar['return_pct'], rel=1e-4)
+            assert vec['annualized_return'][i] == pytest.approx(scalar['annualized_return'], rel=1e-4)
+            assert vec['breakeven_price'][i] == pytest.approx(scalar['breakeven_price'], rel=1e-4)
+
+    def test_call_return_vectorized_matches_scalar(self):
+        """Test vectorized call returns agree with the scalar calculation."""
+        calculator = ReturnCalculator()
+
+        strikes = np.array([105.0, 110.0])
+        premiums = np.array([1.5, 0.8])
+
+        vec = calculator.calculate_call_return_vec(
+            stock_price=100.0,
+            strikes=strikes,
+            premiums=premiums,
+            cost_basis=98.0,
+            days_to_expiration=30
+        )
+
+        for i, (strike, premium) in enumerate(zip(strikes, premiums)):
+            scalar = calculator.calculate_call_return(100.0, strike, premium, 98.0, 30)
+            assert vec['total_return_pct'][i] == pytest.approx(scalar['total_return_pct'], rel=1e-4)
+            assert vec['annualized_return'][i] == pytest.approx(scalar['annualized_return'], rel=1e-4)
+            assert vec['max_profit_price'][i] == pytest.approx(scalar['max_profit_price'], rel=1e-4)
+
+    def test_probability_of_profit_vectorized_matches_scalar(self):
+        """Test vectorized PoP/EV agree with the scalar calculations."""
+        calculator = ReturnCalculator()
+
+        breakevens = np.array([93.0, 97.5])
+        ivs = np.array([0.30, 0.45])
+
+        pops = calculator.calculate_probability_of_profit_vec(100.0, breakevens, ivs, 30)
+        evs = calculator.calculate_expected_value_vec(
+            np.array([2.0, 1.5]), breakevens, pops
+        )
+
+        for i, (breakeven, iv) in enumerate(zip(breakevens, ivs)):
+            scalar_pop = calculator.calculate_probability_of_profit(100.0, breakeven, iv, 30)
+            assert pops[i] == pytest.approx(scalar_pop)
+            scalar_ev = calculator.calculate_expected_value([2.0, 1.5][i], breakeven, scalar_pop)
+            assert evs[i] == pytest.approx(scalar_ev)
+
     def test_sharpe_ratio(self):
         """Test Sharpe ratio calculation."""
         calculator = ReturnCalculator()
@@ -108,6 +170,33 @@ class TestUtilityFunctions:
         assert 0 <= iv_rank <= 100
         assert iv_rank == 50.0  # 0.30 is exactly in the middle
 
+    def test_fast_records_preserves_dtypes(self):
+        """Test fast_records matches to_dict('records') including int columns."""
+        import pandas as pd
+        from src.utils import fast_records
+
+        df = pd.DataFrame({'strike': [95.0, 100.0], 'dte': [30, 45]})
+
+        records = fast_records(df)
+
+        assert records == df.to_dict('records')
+        assert records[0]['dte'] == 30
+        assert isinstance(records[0]['dte'], int)
+        assert isinstance(records[0]['strike'], float)
+
+    def test_calculate_iv_rank_batch(self):
+        """Test batch IV rank matches the scalar calculation."""
+        history = np.array([
+            [0.20, 0.25, 0.30, 0.35, 0.40],
+            [0.30, 0.30, 0.30, 0.30, 0.30],
+        ])
+        current = np.array([0.30, 0.30])
+
+        ranks = calculate_iv_rank_batch(current, history)
+
+        assert ranks[0] == calculate_iv_rank(0.30, history[0].tolist())
+        assert ranks[1] == 50.0  # Flat history defaults to middle
+
     def test_validate_ticker(self):
         """Test ticker validation."""
         assert validate_ticker('aapl') == 'AAPL'